@@ -75,10 +75,10 @@ class RouterConfig(BaseModel):
         """Validate that tags are non-empty strings."""
         if not v:
             return v
-        for tag in v:
-            if not tag or not tag.strip():
-                raise ValueError("Tags cannot be empty")
-        return [tag.strip() for tag in v]
+        stripped_tags = [tag.strip() if tag else "" for tag in v]
+        if not all(stripped_tags):
+            raise ValueError("Tags cannot be empty")
+        return stripped_tags
 
 
 class RouterRegistry:
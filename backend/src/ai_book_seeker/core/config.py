@@ -5,8 +5,10 @@ Access config via create_settings(), not os.environ or global constants.
 """
 
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterator, Mapping, Optional, Set, Tuple
 
 from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,6 +18,21 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 CONFIG_FILE_DIR = Path(__file__).resolve().parent
 BACKEND_DIR = CONFIG_FILE_DIR.parent.parent.parent  # ai_book_seeker/core -> ai_book_seeker -> src -> backend
 BASE_DIR = BACKEND_DIR.parent  # backend -> project_root
+PROMPTS_DIR = BACKEND_DIR / "src" / "ai_book_seeker" / "prompts"
+
+# Versioned prompt file name prefixes by prompt type, e.g. system/system_prompt_v1.txt
+PROMPT_FILE_PREFIXES = {
+    "system": "system_prompt_",
+    "explainer": "explain_recommendation_",
+    "searcher": "search_books_",
+}
+
+# PromptSettings version fields and the prompt type each one selects
+PROMPT_VERSION_FIELDS = {
+    "system_prompt_version": "system",
+    "explainer_version": "explainer",
+    "searcher_version": "searcher",
+}
 
 
 class Environment(str, Enum):
@@ -148,6 +165,49 @@ class LoggingSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="LOGGING_")
 
 
+def get_prompt_file_path(prompt_type: str, version: str) -> Path:
+    """
+    Get the path of a versioned prompt file.
+
+    Args:
+        prompt_type: Prompt type, one of PROMPT_FILE_PREFIXES
+        version: Prompt version, e.g. "v1"
+
+    Returns:
+        Path: Prompt file path, e.g. prompts/system/system_prompt_v1.txt
+    """
+    return PROMPTS_DIR / prompt_type / f"{PROMPT_FILE_PREFIXES[prompt_type]}{version}.txt"
+
+
+def iter_prompt_files() -> Iterator[Tuple[str, str, Path]]:
+    """
+    Iterate over the versioned prompt files on disk.
+
+    Yields:
+        Tuple[str, str, Path]: Prompt type, version and file path of each prompt file
+    """
+    for prompt_type, prefix in PROMPT_FILE_PREFIXES.items():
+        prompt_dir = PROMPTS_DIR / prompt_type
+        if not prompt_dir.exists():
+            continue
+        for prompt_file in prompt_dir.glob(f"{prefix}*.txt"):
+            yield prompt_type, prompt_file.stem[len(prefix) :], prompt_file
+
+
+@lru_cache(maxsize=1)
+def _scan_prompt_versions() -> Mapping[str, FrozenSet[str]]:
+    """
+    Scan the prompts directory once for the available versions of each prompt type.
+
+    Returns:
+        Mapping[str, FrozenSet[str]]: Read-only mapping of prompt type to its available versions
+    """
+    available_versions: Dict[str, Set[str]] = {}
+    for prompt_type, version, _ in iter_prompt_files():
+        available_versions.setdefault(prompt_type, set()).add(version)
+    return MappingProxyType({prompt_type: frozenset(versions) for prompt_type, versions in available_versions.items()})
+
+
 class PromptSettings(BaseSettings):
     system_prompt_version: str = Field(default="v1")
     explainer_version: str = Field(default="v1")
@@ -178,20 +238,14 @@ class PromptSettings(BaseSettings):
         if not v.startswith("v") or not v[1:].isdigit():
             raise ValueError(f"{info.field_name} must be in format 'v1', 'v2', etc. (got: {v})")
 
-        # Check if the prompt file exists
-        base_dir = BACKEND_DIR / "src" / "ai_book_seeker" / "prompts"
-
-        if info.field_name == "system_prompt_version":
-            prompt_file = base_dir / "system" / f"system_prompt_{v}.txt"
-        elif info.field_name == "explainer_version":
-            prompt_file = base_dir / "explainer" / f"explain_recommendation_{v}.txt"
-        elif info.field_name == "searcher_version":
-            prompt_file = base_dir / "searcher" / f"search_books_{v}.txt"
-        else:
+        prompt_type = PROMPT_VERSION_FIELDS.get(info.field_name)
+        if prompt_type is None:
             # This shouldn't happen, but just in case
             return v
 
-        if not prompt_file.exists():
+        # Membership check against the cached directory scan instead of a stat per field
+        if v not in _scan_prompt_versions().get(prompt_type, frozenset()):
+            prompt_file = get_prompt_file_path(prompt_type, v)
             raise ValueError(f"Prompt file not found for {info.field_name}={v}. " f"Expected file: {prompt_file}")
 
         return v
@@ -203,32 +257,8 @@ class PromptSettings(BaseSettings):
         Returns:
             dict: Mapping of prompt type to list of available versions
         """
-        base_dir = BACKEND_DIR / "src" / "ai_book_seeker" / "prompts"
-
-        available_versions = {}
-
-        # Check system prompts
-        system_dir = base_dir / "system"
-        if system_dir.exists():
-            system_files = [f.stem.replace("system_prompt_", "") for f in system_dir.glob("system_prompt_*.txt")]
-            available_versions["system"] = sorted(system_files)
-
-        # Check explainer prompts
-        explainer_dir = base_dir / "explainer"
-        if explainer_dir.exists():
-            explainer_files = [
-                f.stem.replace("explain_recommendation_", "")
-                for f in explainer_dir.glob("explain_recommendation_*.txt")
-            ]
-            available_versions["explainer"] = sorted(explainer_files)
-
-        # Check searcher prompts
-        searcher_dir = base_dir / "searcher"
-        if searcher_dir.exists():
-            searcher_files = [f.stem.replace("search_books_", "") for f in searcher_dir.glob("search_books_*.txt")]
-            available_versions["searcher"] = sorted(searcher_files)
-
-        return available_versions
+        # Prompt files don't change at runtime, so the directory is only scanned once per process
+        return {prompt_type: sorted(versions) for prompt_type, versions in _scan_prompt_versions().items()}
 
     def validate_all_versions(self) -> dict[str, bool]:
         """
@@ -313,6 +343,18 @@ class StartupSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="STARTUP_")
 
 
+class WorkflowSettings(BaseSettings):
+    """Execution limits for the LangGraph workflow."""
+
+    tool_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Per-tool execution budget; tools exceeding it return a tool_error instead of stalling the turn",
+    )
+
+    model_config = SettingsConfigDict(env_prefix="WORKFLOW_")
+
+
 class HealthCheckSettings(BaseSettings):
     """Health check configuration for monitoring and load balancers."""
 
@@ -373,6 +415,7 @@ class AppSettings(BaseSettings):
     security: SecuritySettings = Field(default_factory=SecuritySettings)
     startup: StartupSettings = Field(default_factory=StartupSettings)
     health_check: HealthCheckSettings = Field(default_factory=HealthCheckSettings)
+    workflow: WorkflowSettings = Field(default_factory=WorkflowSettings)
     scripts: ScriptsSettings = Field(default_factory=ScriptsSettings)
     metadata_extraction: MetadataExtractionSettings = Field(default_factory=MetadataExtractionSettings)
 
@@ -458,4 +501,5 @@ __all__ = [
     "ScriptsSettings",
     "MetadataExtractionSettings",
     "StartupSettings",
+    "WorkflowSettings",
 ]
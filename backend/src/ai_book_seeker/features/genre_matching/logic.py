@@ -25,8 +25,6 @@ Business Rules:
 - Threshold-based decisions: configurable minimum similarity
 """
 
-import time
-from functools import wraps
 from typing import Optional
 
 from ai_book_seeker.core.logging import get_logger
@@ -46,45 +44,23 @@ from .constants import GENRE_ALIASES
 logger = get_logger(__name__)
 
 # Configuration Constants
-PERFORMANCE_THRESHOLD_MS = 3000  # threshold for performance warnings
 DEFAULT_SIMILARITY_THRESHOLD = 70.0  # Default threshold for genre matching
 SYNONYM_MATCH_SCORE = 95.0  # High confidence score for synonym matches
 EXACT_MATCH_SCORE = 100.0  # Perfect match score
 
 
 def monitor_performance(func):
-    """Decorator to monitor function performance and log slow operations.
+    """Decorator hook for genre matching performance monitoring.
+
+    Timing is currently disabled, so the function is returned undecorated.
 
     Args:
         func: Function to monitor
 
     Returns:
-        Wrapped function with performance monitoring
-
-    Performance Impact:
-        - Overhead: <0.1ms per function call
-        - Logging: Debug level for normal operations, Warning for slow operations
-        - Threshold: Configurable via PERFORMANCE_THRESHOLD_MS constant
+        The undecorated function
     """
-
     return func
-    # @wraps(func)
-    # def wrapper(*args, **kwargs):
-    #     start_time = time.time()
-    #     result = func(*args, **kwargs)
-    #     execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-
-    #     if execution_time > PERFORMANCE_THRESHOLD_MS:
-    #         logger.warning(
-    #             f"Slow genre matching: {func.__name__} took {execution_time:.2f}ms "
-    #             f"(threshold: {PERFORMANCE_THRESHOLD_MS}ms)"
-    #         )
-    #     else:
-    #         logger.debug(f"Genre matching: {func.__name__} took {execution_time:.2f}ms")
-
-    #     return result
-
-    # return wrapper
 
 
 @monitor_performance
@@ -1,4 +1,8 @@
 import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, ContextManager, Hashable, List, Optional, Tuple
 
 from ai_book_seeker.core.config import AppSettings
 from ai_book_seeker.core.logging import get_logger
@@ -10,24 +14,87 @@ from ai_book_seeker.features.get_book_recommendation.logic import (
 from ai_book_seeker.services.query import search_books_by_criteria
 from ai_book_seeker.utils.helpers import extract_age_range_from_message
 
-from .schema import BookRecommendationOutputSchema, BookRecommendationSchema
+from .schema import BookRecommendation, BookRecommendationOutputSchema, BookRecommendationSchema
 
 logger = get_logger("get_book_recommendation")
 
+# Repeat searches with identical criteria are served from memory for this long
+SEARCH_CACHE_MAXSIZE = 512
+SEARCH_CACHE_TTL_SECONDS = 300
+
+
+class SearchResultCache:
+    """Bounded in-memory LRU cache for book search results with TTL."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Tuple[BookRecommendation, ...]]]" = OrderedDict()
+        # Entries are written from the search worker thread
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[BookRecommendation, ...]]:
+        """Get cached results if present and not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, results = entry
+            if time.monotonic() >= expires_at:
+                # Cache expired, remove entry
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return results
+
+    def set(self, key: Hashable, results: Tuple[BookRecommendation, ...]) -> None:
+        """Cache results, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, results)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global cache instance
+_search_cache = SearchResultCache(SEARCH_CACHE_MAXSIZE, SEARCH_CACHE_TTL_SECONDS)
+
+
+def clear_search_cache() -> None:
+    """Drop all memoized search results (e.g. after catalog updates or between tests)."""
+    _search_cache.clear()
+
 
 async def get_book_recommendation_handler(
     request: BookRecommendationSchema,
     original_message: str,
     settings: AppSettings,
     chromadb_service=None,
+    *,
+    search_fn: Callable[..., List[BookRecommendation]] = search_books_by_criteria,
+    db_session_factory: Callable[[AppSettings], ContextManager] = get_db_session,
 ) -> BookRecommendationOutputSchema:
     """
     Async handler for the get_book_recommendation tool.
 
+    Non-empty results are memoized by the normalized search criteria, so repeated
+    identical searches skip the database for SEARCH_CACHE_TTL_SECONDS.
+
     Args:
         request (BookRecommendationSchema): Validated schema with user preferences (age, purpose, budget, genre).
         original_message (str): The original user query string.
-        settings (AppSettings): Application settings for database configuration.
+        settings (AppSettings): Application settings passed to db_session_factory.
+        chromadb_service: ChromaDB service instance passed through to search_fn.
+        search_fn (Callable): Book search function; defaults to search_books_by_criteria.
+        db_session_factory (Callable): Takes settings and returns a DB session context manager;
+            defaults to get_db_session.
 
     Returns:
         BookRecommendationOutputSchema: Structured response with recommended books and summary text.
@@ -37,13 +104,19 @@ async def get_book_recommendation_handler(
     budget = request.budget
     genre = request.genre
     age_from, age_to = normalize_age_params(request, original_message, extract_age_range_from_message)
+    # Injected callables are part of the key so results from one search function are never served for another
+    cache_key = (search_fn, db_session_factory, age_from, age_to, purpose, budget, genre)
     try:
+        cached_results = _search_cache.get(cache_key)
+        if cached_results is not None:
+            logger.debug(f"Serving book search from cache: {cache_key[2:]}")
+            return format_book_recommendation_result(list(cached_results))
 
         def sync_search():
             try:
-                with get_db_session(settings) as db:
+                with db_session_factory(settings) as db:
                     # Pass age_from and age_to to downstream search logic (to be updated in next task)
-                    return search_books_by_criteria(
+                    results = search_fn(
                         db=db,
                         chromadb_service=chromadb_service,
                         age_from=age_from,
@@ -55,6 +128,11 @@ async def get_book_recommendation_handler(
             except Exception as e:
                 logger.error(f"Error searching books: {e}", exc_info=True)
                 return []
+            # search_books_by_criteria reports its own failures as an empty list, so empty
+            # results are never cached; store an immutable copy of the rest
+            if results:
+                _search_cache.set(cache_key, tuple(results))
+            return results
 
         results = await asyncio.to_thread(sync_search)
         return format_book_recommendation_result(results)
@@ -1,7 +1,7 @@
 import re
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 class BaseBookRecommendationCriteria(BaseModel):
@@ -101,17 +101,26 @@ class BookRecommendationSchema(BaseBookRecommendationCriteria):
     Schema for the get_book_recommendation tool.
 
     Extends BaseBookRecommendationCriteria for tool input validation.
-    Maintains backward compatibility with existing tool usage.
+    Maintains backward compatibility with existing tool usage. Instances are
+    frozen because the handler only reads the criteria.
     """
 
-    pass
+    model_config = ConfigDict(frozen=True)
+
+
+# Validates raw tool parameters (dicts) without unpacking them into keyword arguments
+BOOK_RECOMMENDATION_ADAPTER: TypeAdapter[BookRecommendationSchema] = TypeAdapter(BookRecommendationSchema)
 
 
 class BookRecommendation(BaseModel):
     """
     Output schema for a single recommended book.
+
+    Frozen so results memoized by the handler cannot be mutated by callers.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     title: str
     author: str
@@ -131,5 +140,7 @@ class BookRecommendationOutputSchema(BaseModel):
     Output schema for the Book Recommendation tool. Contains a summary text and a list of recommended books.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     text: str
     data: List[BookRecommendation]
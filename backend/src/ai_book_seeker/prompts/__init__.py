@@ -8,13 +8,29 @@ All prompt configuration (versions, paths, etc.) is accessed via the centralized
 Do not use direct environment variable access or hardcoded values; use only AppSettings.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
-from ai_book_seeker.core.config import AppSettings
+from ai_book_seeker.core.config import PROMPT_FILE_PREFIXES, AppSettings, get_prompt_file_path, iter_prompt_files
 
-# Prompt cache to avoid reading files multiple times
-_prompt_cache: Dict[str, str] = {}
+
+@lru_cache(maxsize=1)
+def _load_all_prompts() -> Dict[Tuple[str, str], str]:
+    """
+    Read every versioned prompt file once, keyed by (prompt type, version).
+
+    Files are discovered with the same naming rules PromptSettings validates against,
+    e.g. searcher/search_books_v1.txt -> ("searcher", "v1").
+
+    Returns:
+        Dict[Tuple[str, str], str]: Prompt contents by (prompt type, version)
+    """
+    # Prompts are small UTF-8 templates: one binary read and decode, no text I/O layer
+    return {
+        (prompt_type, version): prompt_file.read_bytes().decode("utf-8")
+        for prompt_type, version, prompt_file in iter_prompt_files()
+    }
 
 
 def create_prompt_manager(settings: AppSettings) -> "PromptManager":
@@ -41,6 +57,8 @@ class PromptManager:
             settings: Application settings
         """
         self.settings = settings
+        # Shared across instances; the prompt directory is only read on first construction
+        self._prompts = _load_all_prompts()
         self._get_prompt_version = self._create_version_getter()
 
         # Get prompt versions from AppSettings (type-safe, with fallback)
@@ -63,19 +81,13 @@ class PromptManager:
         """
         Get the path to a specific prompt file.
         """
-        base_dir = Path(__file__).parent
-        if prompt_type == "searcher":
-            return base_dir / "searcher" / f"search_books_{version}.txt"
-        elif prompt_type == "explainer":
-            return base_dir / "explainer" / f"explain_recommendation_{version}.txt"
-        elif prompt_type == "system":
-            return base_dir / "system" / f"system_prompt_{version}.txt"
-        else:
+        if prompt_type not in PROMPT_FILE_PREFIXES:
             raise ValueError(f"Unknown prompt type: {prompt_type}")
+        return get_prompt_file_path(prompt_type, version)
 
     def load_prompt(self, prompt_type: str, version: Optional[str] = None) -> str:
         """
-        Load a prompt from a file.
+        Load a prompt from the preloaded prompt files.
         """
         # Determine the version to use
         if version is None:
@@ -92,21 +104,10 @@ class PromptManager:
         if version is None:
             version = "v1"
 
-        # Create a cache key for this prompt
-        cache_key = f"{prompt_type}_{version}"
-        # Check if the prompt is already in cache
-        if cache_key in _prompt_cache:
-            return _prompt_cache[cache_key]
-        # Get the path to the prompt file
-        prompt_path = self.get_prompt_path(prompt_type, version)
-        # Read the prompt file
         try:
-            with open(prompt_path, "r") as f:
-                prompt = f.read()
-            _prompt_cache[cache_key] = prompt
-            return prompt
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+            return self._prompts[(prompt_type, version)]
+        except KeyError:
+            raise FileNotFoundError(f"Prompt file not found: {self.get_prompt_path(prompt_type, version)}")
 
     def get_searcher_prompt(self) -> str:
         """
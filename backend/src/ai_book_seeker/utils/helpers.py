@@ -7,6 +7,12 @@ import re
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
+# Age extraction patterns, checked in this order by extract_age_range_from_message
+_AGE_RANGE_PATTERN = re.compile(r"(?:from\s*)?(\d{1,2})\s*(?:-|to|–)\s*(\d{1,2})", re.IGNORECASE)
+_AGE_LESS_THAN_PATTERN = re.compile(r"(?:under|less than|below)\s*(\d{1,2})", re.IGNORECASE)
+_AGE_GREATER_THAN_PATTERN = re.compile(r"(?:over|more than|above)\s*(\d{1,2})", re.IGNORECASE)
+_SINGLE_AGE_PATTERN = re.compile(r"age\s*(\d{1,2})|(\d{1,2})\s*(?:year[- ]?old)", re.IGNORECASE)
+
 
 def load_text_file(file_path: Union[str, Path]) -> str:
     """
@@ -64,23 +70,19 @@ def extract_age_range_from_message(message: str) -> Tuple[Optional[int], Optiona
     Returns (age_from, age_to)
     """
     # Range: "from 16 to 31", "16-31", "16 to 31"
-    match = re.search(r"(?:from\s*)?(\d{1,2})\s*(?:-|to|–)\s*(\d{1,2})", message, re.IGNORECASE)
-    if match:
+    if match := _AGE_RANGE_PATTERN.search(message):
         return int(match.group(1)), int(match.group(2))
 
     # Less than/under/below
-    match = re.search(r"(?:under|less than|below)\s*(\d{1,2})", message, re.IGNORECASE)
-    if match:
+    if match := _AGE_LESS_THAN_PATTERN.search(message):
         return None, int(match.group(1)) - 1
 
     # Greater than/over/above/more than
-    match = re.search(r"(?:over|more than|above)\s*(\d{1,2})", message, re.IGNORECASE)
-    if match:
+    if match := _AGE_GREATER_THAN_PATTERN.search(message):
         return int(match.group(1)) + 1, None
 
     # Single age
-    match = re.search(r"age\s*(\d{1,2})|(\d{1,2})\s*(?:year[- ]?old)", message, re.IGNORECASE)
-    if match:
+    if match := _SINGLE_AGE_PATTERN.search(message):
         age = int(match.group(1) or match.group(2))
         return age, age
 
@@ -23,7 +23,7 @@ from ai_book_seeker.core.logging import get_logger
 from ai_book_seeker.workflows.schemas import AgentInsight, AgentRole, AgentState, RoutingAnalysis
 from ai_book_seeker.workflows.utils.error_handling import create_error_message, handle_node_error
 from ai_book_seeker.workflows.utils.message_factory import create_ai_message
-from ai_book_seeker.workflows.utils.node_utils import create_command
+from ai_book_seeker.workflows.utils.node_utils import create_command, get_current_query
 
 logger = get_logger(__name__)
 
@@ -195,7 +195,9 @@ class BaseAgent:
         if not state.messages:
             raise ValueError(f"No messages available for {self.name} agent")
 
-        query = state.messages[-1].content
+        query = get_current_query(state)
+        if not query:
+            raise ValueError(f"No user query available for {self.name} agent")
         router_context = self._build_router_context(state.shared_data.routing_analysis)
         prompt = self._create_analysis_prompt(query, router_context)
 
@@ -288,7 +290,7 @@ Router Analysis:
             state: Current workflow state
             insight: Agent's analysis insight
         """
-        state.shared_data.agent_insights.append(insight)
+        state.shared_data.add_agent_insight(insight)
         state.shared_data.current_agent_role = self.role
 
     async def handle(self, state: AgentState) -> Command:
@@ -1,20 +1,37 @@
 # Node name and workflow-related constants for orchestrator and workflow graphs
+#
+# Names are interned at import so membership checks against the frozensets below
+# (and routing comparisons elsewhere) can short-circuit on identity.
 
-START_NODE = "start"
-END_NODE = "end"
-ROUTER_NODE = "router_node"
-GENERAL_AGENT_NODE = "general_agent"
-GENERAL_VOICE_AGENT_NODE = "general_voice_agent"
-# SALES_AGENT_NODE = "sales_agent"  # Temporarily disabled
-AGENT_COORDINATOR_NODE = "agent_coordinator"
-FAQ_TOOL_NODE = "faq_tool"
-BOOK_RECOMMENDATION_TOOL_NODE = "book_recommendation_tool"
-BOOK_DETAILS_TOOL_NODE = "book_details_tool"
-PARAMETER_EXTRACTION_NODE = "parameter_extraction"
-FORMAT_RESPONSE_NODE = "format_response"
-ERROR_NODE = "error"
+import sys
+
+START_NODE = sys.intern("start")
+END_NODE = sys.intern("end")
+ROUTER_NODE = sys.intern("router_node")
+GENERAL_AGENT_NODE = sys.intern("general_agent")
+GENERAL_VOICE_AGENT_NODE = sys.intern("general_voice_agent")
+# SALES_AGENT_NODE = sys.intern("sales_agent")  # Temporarily disabled
+AGENT_COORDINATOR_NODE = sys.intern("agent_coordinator")
+FAQ_TOOL_NODE = sys.intern("faq_tool")
+BOOK_RECOMMENDATION_TOOL_NODE = sys.intern("book_recommendation_tool")
+BOOK_DETAILS_TOOL_NODE = sys.intern("book_details_tool")
+PARAMETER_EXTRACTION_NODE = sys.intern("parameter_extraction")
+FORMAT_RESPONSE_NODE = sys.intern("format_response")
+ERROR_NODE = sys.intern("error")
+
+# Agent nodes that can be dispatched to by the router or agent coordinator
+VALID_AGENT_NODES = frozenset(
+    {
+        GENERAL_AGENT_NODE,
+        GENERAL_VOICE_AGENT_NODE,
+        # SALES_AGENT_NODE,  # Temporarily disabled
+    }
+)
+
+# Targets parameter extraction may route to: agent nodes plus the multi-agent coordinator
+VALID_ROUTING_TARGETS = VALID_AGENT_NODES | {AGENT_COORDINATOR_NODE}
 
 # Message type constants for consistent message handling
-STREAMING_RESPONSE_MESSAGE_TYPE = "streaming_response"
-TOOL_ERROR_MESSAGE_TYPE = "tool_error"
-FINAL_RESPONSE_MESSAGE_TYPE = "final_response"
+STREAMING_RESPONSE_MESSAGE_TYPE = sys.intern("streaming_response")
+TOOL_ERROR_MESSAGE_TYPE = sys.intern("tool_error")
+FINAL_RESPONSE_MESSAGE_TYPE = sys.intern("final_response")
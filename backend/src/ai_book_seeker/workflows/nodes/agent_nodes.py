@@ -19,6 +19,7 @@ Architecture:
 
 from typing import Any, Optional
 
+from langchain_core.language_models import BaseLanguageModel
 from langgraph.types import Command
 
 from ai_book_seeker.core.logging import get_logger
@@ -39,12 +40,16 @@ from ai_book_seeker.workflows.utils.message_factory import (
     create_routing_message,
     create_system_message,
 )
-from ai_book_seeker.workflows.utils.node_utils import create_command, validate_input_state
+from ai_book_seeker.workflows.utils.node_utils import (
+    create_command,
+    get_last_human_message,
+    validate_input_state,
+)
 
 logger = get_logger(__name__)
 
 # Constants for result extraction (scoped to this module)
-RESULT_FIELDS = ["text", "answer", "content", "response", "message"]
+RESULT_FIELDS = ("text", "answer", "content", "response", "message")
 
 
 def _validate_routing_analysis(state: AgentState, trace_id: str, node_name: str) -> Optional[Command]:
@@ -67,7 +72,7 @@ def _validate_routing_analysis(state: AgentState, trace_id: str, node_name: str)
     return None
 
 
-async def supervisor_router_node(state: AgentState, llm) -> Command:
+async def supervisor_router_node(state: AgentState, llm: BaseLanguageModel) -> Command:
     """
     Supervisor router node for intelligent query routing.
 
@@ -96,12 +101,18 @@ async def supervisor_router_node(state: AgentState, llm) -> Command:
     logger.info(f"[{ROUTER_NODE}][{trace_id}] Analyzing query for routing")
 
     try:
-        # Validate input state
+        # New turn: force a fresh validation pass before downstream nodes trust it
+        state.shared_data.input_validated = False
         error_cmd = validate_input_state(state, ROUTER_NODE)
         if error_cmd:
             return error_cmd
 
-        query = state.messages[-1].content
+        # Cache the query once per turn so downstream nodes don't re-walk the message history
+        query = get_last_human_message(state.messages)
+        if not query:
+            raise ValueError("No valid HumanMessage found for routing analysis")
+        state.shared_data.current_query = query
+
         # LLM-based analysis is required for routing (no fallback)
         analysis = await analyze_query_for_routing(query, llm, state.interface)
         if not analysis:
@@ -221,13 +232,11 @@ def format_response_node(state: AgentState) -> Command:
 
     try:
         # Check if this is a streaming response from a single tool
-        streaming_messages = [
-            msg
-            for msg in state.messages
-            if msg.additional_kwargs.get("message_type") == STREAMING_RESPONSE_MESSAGE_TYPE
-        ]
+        streaming_messages_count = sum(
+            1 for msg in state.messages if msg.additional_kwargs.get("message_type") == STREAMING_RESPONSE_MESSAGE_TYPE
+        )
 
-        if streaming_messages:
+        if streaming_messages_count:
             # Don't re-send streaming messages that were already sent by tool nodes
             # Instead, send a completion message or nothing
             logger.info(
@@ -242,7 +251,7 @@ def format_response_node(state: AgentState) -> Command:
                 message_type=FINAL_RESPONSE_MESSAGE_TYPE,
                 additional_kwargs={
                     "completion": True,
-                    "streaming_messages_count": len(streaming_messages),
+                    "streaming_messages_count": streaming_messages_count,
                 },
             )
             return create_command(messages=[completion_msg], state=state, metric_name=FORMAT_RESPONSE_NODE)
@@ -266,21 +275,27 @@ def _create_final_response(state: AgentState, trace_id: str) -> Command:
     Returns:
         Command: Final response command
     """
-    # Define result types and their handlers
-    result_types = [
-        ("faq", "FAQ"),
-        ("book_recommendation", "Book Recommendation"),
-        ("book_details", "Book Details"),
-    ]
+    # The result fields are fixed, so read each one directly rather than looping over getattr by name
+    agent_results = state.agent_results
+    faq = agent_results.faq
+    book_recommendation = agent_results.book_recommendation
+    book_details = agent_results.book_details
 
     response_parts = []
-    for attr_name, display_name in result_types:
-        result = getattr(state.agent_results, attr_name, None)
-        if result:
-            response_parts.append(_extract_result_text(result, trace_id, display_name))
-
-    # Combine responses
-    final_response = "\n\n".join(response_parts) if response_parts else "No results available."
+    if faq:
+        response_parts.append(_extract_result_text(faq, trace_id, "FAQ"))
+    if book_recommendation:
+        response_parts.append(_extract_result_text(book_recommendation, trace_id, "Book Recommendation"))
+    if book_details:
+        response_parts.append(_extract_result_text(book_details, trace_id, "Book Details"))
+
+    # Combine responses (single-tool turns are the common case, so skip the join there)
+    if len(response_parts) == 1:
+        final_response = response_parts[0]
+    elif response_parts:
+        final_response = "\n\n".join(response_parts)
+    else:
+        final_response = "No results available."
 
     # Create final response message using utility
     final_msg = create_system_message(
@@ -290,9 +305,9 @@ def _create_final_response(state: AgentState, trace_id: str) -> Command:
         message_type=FINAL_RESPONSE_MESSAGE_TYPE,
         additional_kwargs={
             "results_count": len(response_parts),
-            "has_faq": state.agent_results.faq is not None,
-            "has_book_recommendation": state.agent_results.book_recommendation is not None,
-            "has_book_details": state.agent_results.book_details is not None,
+            "has_faq": faq is not None,
+            "has_book_recommendation": book_recommendation is not None,
+            "has_book_details": book_details is not None,
         },
     )
     return create_command(messages=[final_msg], state=state, metric_name=FORMAT_RESPONSE_NODE)
@@ -326,17 +341,19 @@ def _extract_result_text(result: Any, trace_id: str, result_type: str) -> str:
         # Handle dictionary results first (most common)
         if isinstance(result, dict):
             for field in RESULT_FIELDS:
-                if field in result and result[field]:
-                    return result[field]
+                value = result.get(field)
+                if value:
+                    return value
 
             # Handle error cases
             if "error" in result:
                 return result.get("message", "Error occurred")
 
-        # Try common text fields on object
+        # Try common text fields on object (single lookup per field)
         for field in RESULT_FIELDS:
-            if hasattr(result, field) and getattr(result, field):
-                return getattr(result, field)
+            value = getattr(result, field, None)
+            if value:
+                return value
 
         # Fallback to string representation
         return str(result)
@@ -14,34 +14,21 @@ Architecture:
 - Performance tracking and metrics collection
 """
 
-from langchain_core.messages import HumanMessage
+from langchain_core.language_models import BaseLanguageModel
 from langgraph.types import Command
 
 from ai_book_seeker.core.logging import get_logger
-from ai_book_seeker.workflows.constants import (  # SALES_AGENT_NODE,  # Temporarily disabled
-    AGENT_COORDINATOR_NODE,
-    GENERAL_AGENT_NODE,
-    GENERAL_VOICE_AGENT_NODE,
-    PARAMETER_EXTRACTION_NODE,
-)
+from ai_book_seeker.workflows.constants import PARAMETER_EXTRACTION_NODE
 from ai_book_seeker.workflows.routing.parameter_extraction import extract_parameters_with_llm
 from ai_book_seeker.workflows.schemas import AgentState
 from ai_book_seeker.workflows.utils.error_handling import handle_node_error
 from ai_book_seeker.workflows.utils.message_factory import create_parameter_message
-from ai_book_seeker.workflows.utils.node_utils import create_command, validate_input_state
+from ai_book_seeker.workflows.utils.node_utils import create_command, get_current_query, validate_input_state
 
 logger = get_logger(__name__)
 
-# Valid routing targets for parameter extraction
-VALID_ROUTING_TARGETS = {
-    AGENT_COORDINATOR_NODE,
-    GENERAL_AGENT_NODE,
-    GENERAL_VOICE_AGENT_NODE,
-    # SALES_AGENT_NODE,  # Temporarily disabled
-}
 
-
-async def parameter_extraction_node(state: AgentState, llm) -> Command:
+async def parameter_extraction_node(state: AgentState, llm: BaseLanguageModel) -> Command:
     """
     Parameter extraction node - extracts parameters from user query.
 
@@ -76,7 +63,7 @@ async def parameter_extraction_node(state: AgentState, llm) -> Command:
         if error_cmd:
             return error_cmd
 
-        query = next((m.content for m in reversed(state.messages) if isinstance(m, HumanMessage)), None)
+        query = get_current_query(state)
         if not query:
             raise ValueError("No valid HumanMessage found for parameter extraction")
 
@@ -3,10 +3,15 @@ Tool node functions for workflow orchestration.
 
 This module contains tool node functions that execute business logic.
 Follows LangGraph best practices for tool node implementation.
+
+Tool nodes fan out in parallel from the agent nodes; each tool call is bounded by
+settings.workflow.tool_timeout_seconds so a single slow dependency degrades to a
+tool_error message instead of stalling format_response for the whole turn.
 """
 
+import asyncio
 import time
-from typing import Any
+from typing import Any, Awaitable, TypeVar
 
 from langgraph.types import Command
 from pydantic import ValidationError
@@ -21,8 +26,9 @@ from ai_book_seeker.workflows.constants import (
 )
 from ai_book_seeker.workflows.schemas import AgentState
 from ai_book_seeker.workflows.tools.tool_logic import run_book_details_tool, run_book_recommendation_tool, run_faq_tool
-from ai_book_seeker.workflows.utils.error_handling import handle_node_error
+from ai_book_seeker.workflows.utils.error_handling import create_error_message
 from ai_book_seeker.workflows.utils.message_factory import create_system_message
+from ai_book_seeker.workflows.utils.node_utils import create_command, get_current_query
 from ai_book_seeker.workflows.utils.response_formatters import (
     format_book_details_response,
     format_book_recommendation_response,
@@ -31,13 +37,41 @@ from ai_book_seeker.workflows.utils.response_formatters import (
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+async def _run_with_timeout(tool_call: Awaitable[T], settings: Any) -> T:
+    """
+    Await a tool call within the configured per-tool budget.
+
+    Args:
+        tool_call: Awaitable tool execution
+        settings: Application settings providing workflow.tool_timeout_seconds
+
+    Returns:
+        T: Tool result
+
+    Raises:
+        TimeoutError: If the tool does not finish within the budget
+    """
+    return await asyncio.wait_for(tool_call, timeout=settings.workflow.tool_timeout_seconds)
+
 
 def _create_streaming_command(
-    state: AgentState, result: Any, node_name: str, tool_name: str, result_field: str, formatted_response: str
+    state: AgentState,
+    result: Any,
+    node_name: str,
+    tool_name: str,
+    result_field: str,
+    formatted_response: str,
+    start_ns: int,
 ) -> Command:
     """
     Create streaming command for tool execution with formatted response.
 
+    Execution time is recorded once, as a structured metric under node_name. Error
+    exits record it the same way through _create_tool_error_command.
+
     Args:
         state: Current workflow state
         result: Tool execution result
@@ -45,6 +79,7 @@ def _create_streaming_command(
         tool_name: Name of the tool for metadata
         result_field: Field name in agent_results to store result
         formatted_response: Formatted response content
+        start_ns: time.perf_counter_ns() taken when the node started
 
     Returns:
         Command: Streaming command with formatted response
@@ -57,15 +92,37 @@ def _create_streaming_command(
         additional_kwargs={"tool_name": tool_name, "streaming": True},
     )
 
-    return Command(
-        update={
-            "messages": [streaming_msg],
-            "agent_results": state.agent_results.model_copy(update={result_field: result}),
-        }
+    return create_command(
+        messages=[streaming_msg],
+        state=state,
+        metric_name=node_name,
+        additional_updates={"agent_results": state.agent_results.model_copy(update={result_field: result})},
+        execution_time_ns=time.perf_counter_ns() - start_ns,
     )
 
 
-def _handle_tool_validation_error(ve: ValidationError, node_name: str, state: AgentState) -> Command:
+def _create_tool_error_command(error_msg: Any, node_name: str, state: AgentState, start_ns: int) -> Command:
+    """
+    Create an error command that still records the node's execution time.
+
+    Args:
+        error_msg: Error message to emit
+        node_name: Name of the tool node
+        state: Current workflow state
+        start_ns: time.perf_counter_ns() taken when the node started
+
+    Returns:
+        Command: Error command carrying the execution time metric
+    """
+    return create_command(
+        messages=[error_msg],
+        state=state,
+        metric_name=node_name,
+        execution_time_ns=time.perf_counter_ns() - start_ns,
+    )
+
+
+def _handle_tool_validation_error(ve: ValidationError, node_name: str, state: AgentState, start_ns: int) -> Command:
     """
     Handle validation errors for tool execution.
 
@@ -73,6 +130,7 @@ def _handle_tool_validation_error(ve: ValidationError, node_name: str, state: Ag
         ve: Validation error
         node_name: Name of the tool node
         state: Current workflow state
+        start_ns: time.perf_counter_ns() taken when the node started
 
     Returns:
         Command: Error command
@@ -84,16 +142,63 @@ def _handle_tool_validation_error(ve: ValidationError, node_name: str, state: Ag
         session_id=state.session_id,
         message_type=TOOL_ERROR_MESSAGE_TYPE,
     )
-    return Command(update={"messages": [error_msg]})
+    return _create_tool_error_command(error_msg, node_name, state, start_ns)
 
 
-async def faq_tool_node(state: AgentState, faq_service: Any) -> Command:
+def _handle_tool_timeout(node_name: str, state: AgentState, settings: Any, start_ns: int) -> Command:
+    """
+    Handle a tool exceeding its execution budget.
+
+    Emits a tool_error message so format_response can still build a response
+    from the tools that did finish.
+
+    Args:
+        node_name: Name of the tool node
+        state: Current workflow state
+        settings: Application settings providing workflow.tool_timeout_seconds
+        start_ns: time.perf_counter_ns() taken when the node started
+
+    Returns:
+        Command: Error command
+    """
+    timeout = settings.workflow.tool_timeout_seconds
+    logger.error(f"[{node_name}][{state.session_id}] Timed out after {timeout:.2f}s")
+    error_msg = create_system_message(
+        content=f"{node_name} timed out after {timeout:.2f}s",
+        node_name=node_name,
+        session_id=state.session_id,
+        message_type=TOOL_ERROR_MESSAGE_TYPE,
+        additional_kwargs={"timeout_seconds": timeout},
+    )
+    return _create_tool_error_command(error_msg, node_name, state, start_ns)
+
+
+def _handle_tool_error(error: Exception, node_name: str, state: AgentState, start_ns: int) -> Command:
+    """
+    Handle unexpected errors for tool execution.
+
+    Args:
+        error: The exception that occurred
+        node_name: Name of the tool node
+        state: Current workflow state
+        start_ns: time.perf_counter_ns() taken when the node started
+
+    Returns:
+        Command: Error command
+    """
+    logger.error(f"[{node_name}][{state.session_id}] Error: {error}")
+    error_msg = create_error_message(error=error, node_name=node_name, session_id=state.session_id)
+    return _create_tool_error_command(error_msg, node_name, state, start_ns)
+
+
+async def faq_tool_node(state: AgentState, faq_service: Any, settings: Any) -> Command:
     """
     FAQ tool node - executes FAQ tool logic with streaming response.
 
     Args:
         state: Current workflow state
         faq_service: FAQ service instance
+        settings: Application settings
 
     Returns:
         Command: Next step in workflow with streaming response
@@ -101,11 +206,9 @@ async def faq_tool_node(state: AgentState, faq_service: Any) -> Command:
     trace_id = state.session_id
     logger.info(f"[FAQTool][{trace_id}] Executing for session {trace_id}")
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     try:
-        result = await run_faq_tool(state.shared_data.extracted_parameters, faq_service)
-        execution_time = time.time() - start_time
-        logger.info(f"[FAQTool][{trace_id}] Execution completed in {execution_time:.2f}s (success: True)")
+        result = await _run_with_timeout(run_faq_tool(state.shared_data.extracted_parameters, faq_service), settings)
 
         # Format FAQ response for immediate streaming
         formatted_response = format_faq_response(result)
@@ -116,13 +219,14 @@ async def faq_tool_node(state: AgentState, faq_service: Any) -> Command:
             tool_name="faq",
             result_field="faq",
             formatted_response=formatted_response,
+            start_ns=start_ns,
         )
     except ValidationError as ve:
-        return _handle_tool_validation_error(ve, FAQ_TOOL_NODE, state)
+        return _handle_tool_validation_error(ve, FAQ_TOOL_NODE, state, start_ns)
+    except TimeoutError:
+        return _handle_tool_timeout(FAQ_TOOL_NODE, state, settings, start_ns)
     except Exception as e:
-        execution_time = time.time() - start_time
-        logger.error(f"[FAQTool][{trace_id}] Error: {e} (execution_time: {execution_time:.2f}s)")
-        return handle_node_error(e, FAQ_TOOL_NODE, state)
+        return _handle_tool_error(e, FAQ_TOOL_NODE, state, start_ns)
 
 
 async def book_recommendation_tool_node(state: AgentState, settings: Any, chromadb_service: Any) -> Command:
@@ -140,13 +244,14 @@ async def book_recommendation_tool_node(state: AgentState, settings: Any, chroma
     trace_id = state.session_id
     logger.info(f"[BookRecTool][{trace_id}] Executing for session {trace_id}")
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     try:
-        result = await run_book_recommendation_tool(
-            state.shared_data.extracted_parameters, state.messages[-1].content, settings, chromadb_service
+        result = await _run_with_timeout(
+            run_book_recommendation_tool(
+                state.shared_data.extracted_parameters, get_current_query(state), settings, chromadb_service
+            ),
+            settings,
         )
-        execution_time = time.time() - start_time
-        logger.info(f"[BookRecTool][{trace_id}] Execution completed in {execution_time:.2f}s (success: True)")
 
         # Format book recommendation response for immediate streaming
         formatted_response = format_book_recommendation_response(result)
@@ -157,13 +262,14 @@ async def book_recommendation_tool_node(state: AgentState, settings: Any, chroma
             tool_name="book_recommendation",
             result_field="book_recommendation",
             formatted_response=formatted_response,
+            start_ns=start_ns,
         )
     except ValidationError as ve:
-        return _handle_tool_validation_error(ve, BOOK_RECOMMENDATION_TOOL_NODE, state)
+        return _handle_tool_validation_error(ve, BOOK_RECOMMENDATION_TOOL_NODE, state, start_ns)
+    except TimeoutError:
+        return _handle_tool_timeout(BOOK_RECOMMENDATION_TOOL_NODE, state, settings, start_ns)
     except Exception as e:
-        execution_time = time.time() - start_time
-        logger.error(f"[BookRecTool][{trace_id}] Error: {e} (execution_time: {execution_time:.2f}s)")
-        return handle_node_error(e, BOOK_RECOMMENDATION_TOOL_NODE, state)
+        return _handle_tool_error(e, BOOK_RECOMMENDATION_TOOL_NODE, state, start_ns)
 
 
 async def book_details_tool_node(state: AgentState, settings: Any) -> Command:
@@ -180,11 +286,11 @@ async def book_details_tool_node(state: AgentState, settings: Any) -> Command:
     trace_id = state.session_id
     logger.info(f"[BookDetailsTool][{trace_id}] Executing for session {trace_id}")
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     try:
-        result = await run_book_details_tool(state.shared_data.extracted_parameters, settings)
-        execution_time = time.time() - start_time
-        logger.info(f"[BookDetailsTool][{trace_id}] Execution completed in {execution_time:.2f}s (success: True)")
+        result = await _run_with_timeout(
+            run_book_details_tool(state.shared_data.extracted_parameters, settings), settings
+        )
 
         # Format book details response for immediate streaming
         formatted_response = format_book_details_response(result)
@@ -195,10 +301,11 @@ async def book_details_tool_node(state: AgentState, settings: Any) -> Command:
             tool_name="book_details",
             result_field="book_details",
             formatted_response=formatted_response,
+            start_ns=start_ns,
         )
     except ValidationError as ve:
-        return _handle_tool_validation_error(ve, BOOK_DETAILS_TOOL_NODE, state)
+        return _handle_tool_validation_error(ve, BOOK_DETAILS_TOOL_NODE, state, start_ns)
+    except TimeoutError:
+        return _handle_tool_timeout(BOOK_DETAILS_TOOL_NODE, state, settings, start_ns)
     except Exception as e:
-        execution_time = time.time() - start_time
-        logger.error(f"[BookDetailsTool][{trace_id}] Error: {e} (execution_time: {execution_time:.2f}s)")
-        return handle_node_error(e, BOOK_DETAILS_TOOL_NODE, state)
+        return _handle_tool_error(e, BOOK_DETAILS_TOOL_NODE, state, start_ns)
@@ -49,6 +49,7 @@ from ai_book_seeker.workflows.constants import (  # SALES_AGENT_NODE,  # Tempora
     GENERAL_VOICE_AGENT_NODE,
     PARAMETER_EXTRACTION_NODE,
     ROUTER_NODE,
+    VALID_ROUTING_TARGETS,
 )
 from ai_book_seeker.workflows.registration.node_registration import create_agent_tool_map
 from ai_book_seeker.workflows.schemas.state import AgentState
@@ -249,15 +250,8 @@ def _get_parameter_extraction_routing_targets(state: AgentState) -> str:
     if state.shared_data.routing_analysis:
         next_node = state.shared_data.routing_analysis.next_node
         logger.debug(f"[Routing][parameter_extraction] next_node: {next_node}")
-        logger.debug(
-            f"[Routing][parameter_extraction] constants: "
-            f"{[GENERAL_AGENT_NODE, GENERAL_VOICE_AGENT_NODE, AGENT_COORDINATOR_NODE]}"  # SALES_AGENT_NODE temporarily disabled
-        )
-        if next_node in {
-            GENERAL_AGENT_NODE,
-            GENERAL_VOICE_AGENT_NODE,
-            AGENT_COORDINATOR_NODE,
-        }:  # SALES_AGENT_NODE temporarily disabled
+        logger.debug(f"[Routing][parameter_extraction] constants: {sorted(VALID_ROUTING_TARGETS)}")
+        if next_node in VALID_ROUTING_TARGETS:
             logger.debug(f"Routing to next node: {next_node}")
             return next_node
 
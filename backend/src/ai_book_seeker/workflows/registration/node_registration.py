@@ -180,7 +180,7 @@ def create_tool_node_map(faq_service: Any, settings: Any, chromadb_service: Any)
     """
     # Define tool bindings with dependency injection
     tool_bindings = [
-        (FAQ_TOOL_NODE, (faq_tool_node, {"faq_service": faq_service})),
+        (FAQ_TOOL_NODE, (faq_tool_node, {"faq_service": faq_service, "settings": settings})),
         (
             BOOK_RECOMMENDATION_TOOL_NODE,
             (book_recommendation_tool_node, {"settings": settings, "chromadb_service": chromadb_service}),
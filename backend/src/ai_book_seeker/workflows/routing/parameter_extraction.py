@@ -12,6 +12,9 @@ from ai_book_seeker.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Separators stripped from ISBNs before validation
+_ISBN_STRIP_TABLE = str.maketrans("", "", "- ")
+
 
 async def extract_parameters_with_llm(query: str, llm) -> dict:
     """
@@ -145,9 +148,9 @@ def _validate_and_clean_parameters(params: dict) -> dict:
 
     # ISBN validation
     if "isbn" in params:
-        isbn = _safe_string(params["isbn"])
+        isbn = _safe_string(params["isbn"]).translate(_ISBN_STRIP_TABLE)
         # Basic ISBN validation (10 or 13 digits)
-        if re.match(r"^\d{10,13}$", isbn):
+        if len(isbn) in (10, 13) and isbn.isdigit():
             cleaned["isbn"] = isbn
 
     return cleaned
@@ -27,20 +27,22 @@ class RoutingConstants:
     MAX_REASONING_WORDS = 50
 
     # Node name patterns
-    VALID_NODE_PATTERNS = [
-        "general_agent",
-        "general_voice_agent",
-        "sales_agent",
-        "agent_coordinator",
-        "parameter_extraction",
-        "parallel_tool_execution",
-        "merge_tools",
-        "format_response",
-        "error",
-    ]
+    VALID_NODE_PATTERNS = frozenset(
+        {
+            "general_agent",
+            "general_voice_agent",
+            "sales_agent",
+            "agent_coordinator",
+            "parameter_extraction",
+            "parallel_tool_execution",
+            "merge_tools",
+            "format_response",
+            "error",
+        }
+    )
 
     # Agent name patterns
-    VALID_AGENT_PATTERNS = ["general_agent", "general_voice_agent"]  # "sales_agent" temporarily disabled
+    VALID_AGENT_PATTERNS = frozenset({"general_agent", "general_voice_agent"})  # "sales_agent" temporarily disabled
 
 
 class RoutingAnalysis(BaseModel):
@@ -100,16 +102,16 @@ class RoutingAnalysis(BaseModel):
     @classmethod
     def validate_next_node(cls, v: str) -> str:
         """Validate that next_node is a valid workflow node."""
-        # Direct validation
-        if not v or not v.strip():
+        cleaned_value = v.strip() if v else ""
+        if not cleaned_value:
             raise ValueError("next_node cannot be empty")
 
-        cleaned_value = v.strip()
-
         # Validate pattern without failing (just log warning)
         if cleaned_value not in RoutingConstants.VALID_NODE_PATTERNS:
             logger.warning(
-                f"Unknown node pattern: {cleaned_value}. Valid patterns: {RoutingConstants.VALID_NODE_PATTERNS}"
+                "Unknown node pattern: %s. Valid patterns: %s",
+                cleaned_value,
+                sorted(RoutingConstants.VALID_NODE_PATTERNS),
             )
 
         return cleaned_value
@@ -119,18 +121,13 @@ class RoutingAnalysis(BaseModel):
     def validate_participating_agents(cls, v: List[str]) -> List[str]:
         """Validate that participating_agents contains valid agent names."""
 
-        validated_agents = []
-        for agent in v:
-            if not agent or not agent.strip():
-                continue  # Skip empty agents
-
-            agent = agent.strip()
-            if agent not in RoutingConstants.VALID_AGENT_PATTERNS:
-                logger.warning(
-                    f"Unknown agent pattern: {agent}. Valid patterns: {RoutingConstants.VALID_AGENT_PATTERNS}"
-                )
+        # Strip names and skip empty agents
+        validated_agents = [agent for agent in (name.strip() for name in v if name) if agent]
 
-            validated_agents.append(agent)
+        valid_agents = RoutingConstants.VALID_AGENT_PATTERNS
+        for agent in validated_agents:
+            if agent not in valid_agents:
+                logger.warning("Unknown agent pattern: %s. Valid patterns: %s", agent, sorted(valid_agents))
 
         return validated_agents
 
@@ -149,14 +146,12 @@ class RoutingAnalysis(BaseModel):
         if not cleaned:
             return None
 
-        # Check word count (max 30 words)
-        words = cleaned.split()
-        if len(words) > RoutingConstants.MAX_REASONING_WORDS:
-            logger.warning(
-                f"Reasoning exceeds {RoutingConstants.MAX_REASONING_WORDS} words ({len(words)} words), truncating"
-            )
-            truncated_words = words[: RoutingConstants.MAX_REASONING_WORDS]
-            return " ".join(truncated_words) + "..."
+        # Check word count, splitting at most one word past the limit so long input is never fully split
+        max_words = RoutingConstants.MAX_REASONING_WORDS
+        words = cleaned.split(None, max_words)
+        if len(words) > max_words:
+            logger.warning("Reasoning exceeds %d words, truncating", max_words)
+            return " ".join(words[:max_words]) + "..."
 
         return cleaned
 
@@ -180,7 +175,7 @@ class RoutingAnalysis(BaseModel):
         Returns:
             int: Number of agents that will participate in processing
         """
-        return len(self.participating_agents) if self.participating_agents else 0
+        return len(self.participating_agents)
 
     def requires_coordination(self) -> bool:
         """
@@ -189,7 +184,7 @@ class RoutingAnalysis(BaseModel):
         Returns:
             bool: True if multiple agents need to be coordinated
         """
-        return self.is_multi_agent and self.get_agent_count() > 1
+        return self.is_multi_agent and len(self.participating_agents) > 1
 
     def __str__(self) -> str:
         """String representation for logging and debugging."""
@@ -2,12 +2,14 @@
 State management schemas and utilities for workflow orchestration.
 """
 
+import logging
 import time
-from typing import Annotated, Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Annotated, Any, Dict, List, Literal, Optional, Set, Union
 
-from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages import AnyMessage, HumanMessage
 from langgraph.graph.message import add_messages
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from ai_book_seeker.core.logging import get_logger
 
@@ -16,6 +18,13 @@ from .routing import RoutingAnalysis
 
 logger = get_logger(__name__)
 
+# Bounds for the in-process state cache
+DEFAULT_STATE_CACHE_SIZE = 1024
+STATE_CLEANUP_THRESHOLD = 0.8  # Fraction of capacity above which the TTL sweep runs
+
+# Supported client interfaces, validated by pydantic-core rather than a Python-side check
+InterfaceType = Literal["chat", "voice"]
+
 
 class TimestampedModel(BaseModel):
     """Base class for models that track creation and access timestamps."""
@@ -27,7 +36,12 @@ class TimestampedModel(BaseModel):
     model_config = {"validate_assignment": True, "extra": "forbid"}
 
     def update_access_metrics(self) -> None:
-        """Update access metrics for performance tracking."""
+        """
+        Update access metrics for performance tracking.
+
+        last_accessed is persisted by the checkpointer, exported as a timestamp in performance
+        metrics and compared across workers on merge, so it stays on the wall clock.
+        """
         self.last_accessed = time.time()
         self.access_count += 1
 
@@ -50,75 +64,115 @@ class SharedData(TimestampedModel, PerformanceTrackedModel):
     selected_tools_for_parallel: Optional[List[str]] = None
     participating_agents_for_parallel: Optional[List[str]] = None
     routing_analysis: Optional[RoutingAnalysis] = None
+    input_validated: bool = Field(default=False, description="Whether input state passed validation this turn")
+    current_query: Optional[str] = Field(default=None, description="Latest user query, cached at router entry")
 
+    # Only workflow nodes assign to SharedData, always with already-typed values, so skip
+    # per-assignment validation on this hot path. Construction is still validated.
+    model_config = {"validate_assignment": False, "extra": "forbid"}
 
-def merge_agent_results(left: AgentResults, right: AgentResults) -> AgentResults:
-    """Merge two AgentResults objects for concurrent updates in LangGraph."""
-    try:
-        merged = left.model_copy()
+    # Agent names present in agent_insights, maintained incrementally for O(1) dedup on merge
+    _insight_agent_names: Set[str] = PrivateAttr(default_factory=set)
 
-        if right.faq is not None:
-            merged.faq = right.faq
+    def get_insight_agent_names(self) -> Set[str]:
+        """Get the set of agent names that have contributed insights."""
+        # Dedup keeps names unique, so a size mismatch means agent_insights was set without
+        # add_agent_insight (construction, deserialization or reassignment) and the set is stale
+        if len(self._insight_agent_names) != len(self.agent_insights):
+            self._insight_agent_names = {insight.agent_name for insight in self.agent_insights}
+        return self._insight_agent_names
 
-        if right.book_recommendation is not None:
-            merged.book_recommendation = right.book_recommendation
+    def add_agent_insight(self, insight: AgentInsight) -> None:
+        """Append an agent insight and record its agent name."""
+        self.get_insight_agent_names().add(insight.agent_name)
+        self.agent_insights.append(insight)
 
-        if right.book_details is not None:
-            merged.book_details = right.book_details
 
-        return merged
+# Reducers never mutate their inputs: LangGraph shares channel values between channel copies and
+# checkpoints, so writing into left would leak into earlier snapshots. Inputs are already-validated
+# model instances, so merges rebuild the result with model_construct and skip re-validation.
+# Set to False to validate merged state instead.
+_TRUSTED_MERGE = True
+
+
+def merge_agent_results(left: AgentResults, right: AgentResults) -> AgentResults:
+    """Merge two AgentResults objects for concurrent updates in LangGraph."""
+    if right is left:
+        return left
+    try:
+        faq = right.faq if right.faq is not None else left.faq
+        book_recommendation = (
+            right.book_recommendation if right.book_recommendation is not None else left.book_recommendation
+        )
+        book_details = right.book_details if right.book_details is not None else left.book_details
+        if _TRUSTED_MERGE:
+            return AgentResults.model_construct(
+                faq=faq, book_recommendation=book_recommendation, book_details=book_details
+            )
+        return AgentResults.model_validate(
+            {"faq": faq, "book_recommendation": book_recommendation, "book_details": book_details}
+        )
     except Exception:
         return right
 
 
 def merge_shared_data(left: SharedData, right: SharedData) -> SharedData:
     """Merge SharedData objects for concurrent updates in LangGraph."""
+    if right is left:
+        return left
     try:
-        merged = left.model_copy()
+        values = dict(left)
 
+        # Fresh containers so the merged model never aliases left's list or dict
+        insight_agent_names = set(left.get_insight_agent_names())
+        merged_insights = list(left.agent_insights)
         if right.agent_insights:
             # Deduplication logic: only add insights that don't already exist from the same agent
-            existing_agent_names = {insight.agent_name for insight in merged.agent_insights}
-            new_insights = []
+            known_add = insight_agent_names.add
+            insights_append = merged_insights.append
             for insight in right.agent_insights:
-                if insight.agent_name not in existing_agent_names:
-                    new_insights.append(insight)
-                    logger.debug(f"Adding new insight from agent: {insight.agent_name}")
-                else:
-                    logger.debug(f"Skipping duplicate insight from agent: {insight.agent_name}")
-
-            if new_insights:
-                merged.agent_insights.extend(new_insights)
-                logger.info(
-                    f"Added {len(new_insights)} new insights, skipped {len(right.agent_insights) - len(new_insights)} duplicates"
+                agent_name = insight.agent_name
+                if agent_name not in insight_agent_names:
+                    known_add(agent_name)
+                    insights_append(insight)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                added = len(merged_insights) - len(left.agent_insights)
+                logger.debug(
+                    "Merged agent insights: added %d, skipped %d duplicates", added, len(right.agent_insights) - added
                 )
-            else:
-                logger.info(f"All {len(right.agent_insights)} insights were duplicates, none added")
-
-        if right.performance_metrics:
-            merged.performance_metrics.update(right.performance_metrics)
+        values["agent_insights"] = merged_insights
+        values["performance_metrics"] = {**left.performance_metrics, **right.performance_metrics}
 
         if right.routing_analysis is not None:
-            merged.routing_analysis = right.routing_analysis
+            values["routing_analysis"] = right.routing_analysis
 
         if right.extracted_parameters is not None:
-            merged.extracted_parameters = right.extracted_parameters
+            values["extracted_parameters"] = right.extracted_parameters
 
         if right.correlation_id is not None:
-            merged.correlation_id = right.correlation_id
+            values["correlation_id"] = right.correlation_id
 
         if right.current_agent_role is not None:
-            merged.current_agent_role = right.current_agent_role
+            values["current_agent_role"] = right.current_agent_role
 
         if right.selected_tools_for_parallel is not None:
-            merged.selected_tools_for_parallel = right.selected_tools_for_parallel
+            values["selected_tools_for_parallel"] = right.selected_tools_for_parallel
 
         if right.participating_agents_for_parallel is not None:
-            merged.participating_agents_for_parallel = right.participating_agents_for_parallel
+            values["participating_agents_for_parallel"] = right.participating_agents_for_parallel
 
-        merged.access_count = left.access_count + right.access_count
-        merged.last_accessed = max(left.last_accessed or 0, right.last_accessed or 0)
+        if right.current_query is not None:
+            values["current_query"] = right.current_query
 
+        values["input_validated"] = right.input_validated
+        values["access_count"] = left.access_count + right.access_count
+        left_accessed = left.last_accessed or 0
+        right_accessed = right.last_accessed or 0
+        values["last_accessed"] = left_accessed if left_accessed > right_accessed else right_accessed
+
+        merged = SharedData.model_construct(**values) if _TRUSTED_MERGE else SharedData.model_validate(values)
+        merged._insight_agent_names = insight_agent_names
         return merged
     except Exception:
         return right
@@ -128,29 +182,21 @@ class AgentState(TimestampedModel, PerformanceTrackedModel):
     """State for the LangGraph workflow."""
 
     session_id: str
-    interface: str
+    interface: InterfaceType
     current_agent: str
-    messages: Annotated[List[BaseMessage], add_messages]
+    # Discriminated on message type so JSON rehydration restores the concrete message subclasses
+    messages: Annotated[List[AnyMessage], add_messages]
     shared_data: Annotated[SharedData, merge_shared_data]
     agent_results: Annotated[AgentResults, merge_agent_results]
-    execution_start_time: Optional[float] = Field(default=None, description="Workflow execution start time")
-
-    def __init__(self, **data):
-        super().__init__(**data)
-        current_time = time.time()
-        self.created_at = current_time
-        self.execution_start_time = current_time
+    created_at: Optional[float] = Field(default_factory=time.time, description="Creation timestamp")
+    execution_start_time: Optional[float] = Field(
+        default_factory=time.time, description="Workflow execution start time"
+    )
 
     def validate_state_consistency(self) -> bool:
         """Validate state consistency and return True if valid."""
-        return (
-            bool(self.session_id and self.session_id.strip())
-            and self.interface in {"chat", "voice"}
-            and bool(self.current_agent and self.current_agent.strip())
-            and isinstance(self.messages, list)
-            and isinstance(self.shared_data, SharedData)
-            and isinstance(self.agent_results, AgentResults)
-        )
+        # Field types and the interface literal are enforced by pydantic at construction
+        return bool(self.session_id and self.session_id.strip() and self.current_agent and self.current_agent.strip())
 
     def get_execution_time(self) -> float:
         """Get current execution time in seconds."""
@@ -170,15 +216,44 @@ class AgentState(TimestampedModel, PerformanceTrackedModel):
             "has_extracted_parameters": self.shared_data.extracted_parameters is not None,
         }
 
+    @classmethod
+    def from_json(cls, payload: Union[str, bytes]) -> "AgentState":
+        """
+        Rehydrate a state from its JSON form in a single pydantic-core pass.
+
+        Args:
+            payload: JSON produced by to_json()
+
+        Returns:
+            AgentState: Validated state
+        """
+        return cls.model_validate_json(payload)
+
+    def to_json(self) -> str:
+        """
+        Serialize the state to JSON for persistence.
+
+        Returns:
+            str: JSON representation accepted by from_json()
+        """
+        return self.model_dump_json()
+
 
 class StateManager:
-    """Utility class for efficient state management operations."""
+    """
+    Utility class for efficient state management operations.
+
+    States persisted outside this cache should round-trip through AgentState.to_json() and
+    AgentState.from_json() rather than json.dumps(model_dump()) / model_validate(json.loads(...)).
+    """
 
-    def __init__(self):
-        self.state_cache = {}
+    def __init__(self, max_size: int = DEFAULT_STATE_CACHE_SIZE):
+        self.state_cache: OrderedDict[str, AgentState] = OrderedDict()
+        self._max_size = max_size
+        self._total_sessions = 0
 
     def create_initial_state(
-        self, session_id: str, interface: str, message: str, correlation_id: Optional[str] = None
+        self, session_id: str, interface: InterfaceType, message: str, correlation_id: Optional[str] = None
     ) -> AgentState:
         """Create an optimized initial state with proper initialization."""
         shared_data = SharedData(
@@ -198,16 +273,39 @@ class StateManager:
         if not state.validate_state_consistency():
             raise ValueError(f"State validation failed for session {session_id} during initialization")
 
+        # Pop first so a replaced session moves to the most recent end
+        self.state_cache.pop(session_id, None)
         self.state_cache[session_id] = state
+        self._total_sessions += 1
+
+        if len(self.state_cache) > self._max_size:
+            self.state_cache.popitem(last=False)
         return state
 
     def get_state_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get state summary for monitoring and debugging."""
         state = self.state_cache.get(session_id)
-        return state.get_state_summary() if state else None
+        if state is None:
+            return None
+        self.state_cache.move_to_end(session_id)
+        return state.get_state_summary()
 
     def cleanup_old_states(self, max_age_seconds: int = 3600) -> int:
-        """Clean up old states to free memory."""
+        """
+        Clean up old states to free memory.
+
+        The cache is already bounded by LRU eviction, so the TTL sweep only runs once the
+        cache is above STATE_CLEANUP_THRESHOLD of its capacity.
+
+        Args:
+            max_age_seconds: Maximum state age before it is removed
+
+        Returns:
+            int: Number of states removed
+        """
+        if len(self.state_cache) <= self._max_size * STATE_CLEANUP_THRESHOLD:
+            return 0
+
         current_time = time.time()
         sessions_to_remove = [
             session_id
@@ -221,12 +319,23 @@ class StateManager:
         return len(sessions_to_remove)
 
     def get_performance_metrics(self) -> Dict[str, Any]:
-        """Get performance metrics for state management."""
-        states = list(self.state_cache.values())
+        """
+        Get performance metrics for state management.
+
+        - total_sessions_processed is a running count of every state created over the manager's
+          lifetime, including replaced and evicted sessions, not just the ones currently cached.
+        - average_access_count reflects each cached session's live access count.
+
+        Returns:
+            Dict[str, Any]: State cache metrics
+        """
+        cached_count = len(self.state_cache)
+        # Sum straight off the cache view rather than materializing a list of states
+        total_access_count = sum(state.shared_data.access_count for state in self.state_cache.values())
         return {
-            "cached_states_count": len(self.state_cache),
-            "total_sessions_processed": len(states),
-            "average_access_count": sum(state.shared_data.access_count for state in states) / max(len(states), 1),
+            "cached_states_count": cached_count,
+            "total_sessions_processed": self._total_sessions,
+            "average_access_count": total_access_count / max(cached_count, 1),
             "memory_optimization_enabled": True,
         }
 
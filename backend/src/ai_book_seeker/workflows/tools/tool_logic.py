@@ -9,8 +9,8 @@ from ai_book_seeker.features.get_book_recommendation.handler import (
     get_book_recommendation_handler,
 )
 from ai_book_seeker.features.get_book_recommendation.schema import (
+    BOOK_RECOMMENDATION_ADAPTER,
     BookRecommendationOutputSchema,
-    BookRecommendationSchema,
 )
 from ai_book_seeker.features.search_faq.handler import faq_handler
 from ai_book_seeker.features.search_faq.schema import FAQOutputSchema, FAQSchema
@@ -46,7 +46,7 @@ async def run_book_recommendation_tool(extracted_parameters, original_message, s
     Returns:
         BookRecommendationOutputSchema: Book recommendation tool result
     """
-    rec_input = BookRecommendationSchema(**(extracted_parameters or {}))
+    rec_input = BOOK_RECOMMENDATION_ADAPTER.validate_python(extracted_parameters or {})
     result: BookRecommendationOutputSchema = await get_book_recommendation_handler(
         rec_input, original_message, settings, chromadb_service
     )
@@ -0,0 +1,79 @@
+"""
+Command builder for workflow nodes.
+
+This module provides a lightweight, slotted builder for LangGraph Commands so nodes
+accumulate messages and state writes directly into the single update dict that the
+Command is built from. Returns whose update is known up front should use a plain
+Command literal instead.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from langgraph.types import Command
+
+
+class CommandBuilder:
+    """
+    Accumulates messages and state updates for a single node return.
+
+    The builder is single-use: build() hands its update dict to the Command, so a
+    second call raises instead of returning another Command sharing that dict.
+
+    Example:
+        ```python
+        return CommandBuilder().add_message(msg).set("agent_results", results).build()
+        # Returns: Command(update={"messages": [msg], "agent_results": results})
+        ```
+    """
+
+    __slots__ = ("_update",)
+
+    def __init__(self, messages: Optional[List[Any]] = None) -> None:
+        """
+        Initialize the builder.
+
+        Args:
+            messages: Optional message list to start from; it is taken over, not copied
+        """
+        # The Command update dict is built here and handed over as-is by build()
+        self._update: Optional[Dict[str, Any]] = {"messages": messages if messages is not None else []}
+
+    def _pending_update(self) -> Dict[str, Any]:
+        """Return the update dict, rejecting writes after build()."""
+        if self._update is None:
+            raise RuntimeError("CommandBuilder has already been built")
+        return self._update
+
+    def add_message(self, message: Any) -> "CommandBuilder":
+        """Append a single message to the update."""
+        self._pending_update()["messages"].append(message)
+        return self
+
+    def add_messages(self, messages: List[Any]) -> "CommandBuilder":
+        """Append several messages to the update."""
+        self._pending_update()["messages"].extend(messages)
+        return self
+
+    def set(self, key: str, value: Any) -> "CommandBuilder":
+        """Set a state channel value on the update."""
+        self._pending_update()[key] = value
+        return self
+
+    def update(self, updates: Dict[str, Any]) -> "CommandBuilder":
+        """Set several state channel values on the update."""
+        self._pending_update().update(updates)
+        return self
+
+    def build(self) -> Command:
+        """
+        Build the Command.
+
+        Returns:
+            Command: Command whose update holds the messages followed by any state writes
+
+        Raises:
+            RuntimeError: If the builder has already been built
+        """
+        update = self._pending_update()
+        self._update = None
+        return Command(update=update)
@@ -11,6 +11,19 @@ from langchain_core.messages import AIMessage, SystemMessage
 
 from ai_book_seeker.workflows.constants import AGENT_COORDINATOR_NODE, PARAMETER_EXTRACTION_NODE, ROUTER_NODE
 
+# Static additional_kwargs for fixed-shape node messages, built once at import.
+# Per-call fields are layered on top with a single dict merge.
+_ROUTING_MESSAGE_SKELETON: Dict[str, Any] = {"agent_name": ROUTER_NODE, "message_type": "routing_decision"}
+_COORDINATION_MESSAGE_SKELETON: Dict[str, Any] = {
+    "agent_name": AGENT_COORDINATOR_NODE,
+    "message_type": "agent_coordination_start",
+    "performance_optimized": False,
+}
+_PARAMETER_MESSAGE_SKELETON: Dict[str, Any] = {
+    "agent_name": PARAMETER_EXTRACTION_NODE,
+    "message_type": "parameter_extraction_complete",
+}
+
 
 def _create_base_kwargs(
     name: str,
@@ -35,16 +48,9 @@ def _create_base_kwargs(
     Returns:
         Dict[str, Any]: Standardized base keyword arguments
     """
-    base_kwargs = {
-        name_key: name,
-        "session_id": session_id,
-        "message_type": message_type,
-    }
-
     if additional_kwargs:
-        base_kwargs.update(additional_kwargs)
-
-    return base_kwargs
+        return {name_key: name, "session_id": session_id, "message_type": message_type, **additional_kwargs}
+    return {name_key: name, "session_id": session_id, "message_type": message_type}
 
 
 def create_system_message(
@@ -167,12 +173,11 @@ def create_routing_message(
     Returns:
         SystemMessage: Standardized routing message
     """
-    return create_system_message(
+    return SystemMessage(
         content=f"Query analyzed. Routing to {next_node}",
-        node_name=ROUTER_NODE,
-        session_id=session_id,
-        message_type="routing_decision",
         additional_kwargs={
+            **_ROUTING_MESSAGE_SKELETON,
+            "session_id": session_id,
             "next_node": next_node,
             "participating_agents": participating_agents,
             "confidence": confidence,
@@ -194,15 +199,14 @@ def create_coordination_message(
     Returns:
         SystemMessage: Standardized coordination message
     """
-    return create_system_message(
-        content=f"Coordinating {len(participating_agents)} agents for multi-agent query",
-        node_name=AGENT_COORDINATOR_NODE,
-        session_id=session_id,
-        message_type="agent_coordination_start",
+    agents_count = len(participating_agents)
+    return SystemMessage(
+        content=f"Coordinating {agents_count} agents for multi-agent query",
         additional_kwargs={
-            "agents_count": len(participating_agents),
+            **_COORDINATION_MESSAGE_SKELETON,
+            "session_id": session_id,
+            "agents_count": agents_count,
             "participating_agents": participating_agents,
-            "performance_optimized": False,
         },
     )
 
@@ -221,13 +225,13 @@ def create_parameter_message(
     Returns:
         SystemMessage: Standardized parameter message
     """
-    return create_system_message(
-        content=f"Parameters extracted: {len(extracted_parameters)} parameters found",
-        node_name=PARAMETER_EXTRACTION_NODE,
-        session_id=session_id,
-        message_type="parameter_extraction_complete",
+    parameters_count = len(extracted_parameters)
+    return SystemMessage(
+        content=f"Parameters extracted: {parameters_count} parameters found",
         additional_kwargs={
-            "parameters_count": len(extracted_parameters),
+            **_PARAMETER_MESSAGE_SKELETON,
+            "session_id": session_id,
+            "parameters_count": parameters_count,
             "extracted_parameters": extracted_parameters,
         },
     )
@@ -5,8 +5,9 @@ Provides state validation, metrics tracking, and standardized Command creation
 for workflow nodes. Error handling is provided by workflows/utils/error_handling.py
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
+from langchain_core.messages import BaseMessage
 from langgraph.types import Command
 
 from ai_book_seeker.core.logging import get_logger
@@ -20,6 +21,10 @@ def validate_input_state(state: AgentState, node_name: str) -> Optional[Command]
     """
     Validate input state before node processing.
 
+    Input is immutable within a turn, so once a node has validated it the result
+    is recorded on shared_data and downstream nodes skip the checks. The router
+    clears the flag at turn start.
+
     Args:
         state: Current workflow state to validate
         node_name: Name of the node for error context
@@ -27,6 +32,9 @@ def validate_input_state(state: AgentState, node_name: str) -> Optional[Command]
     Returns:
         Optional[Command]: Error command if validation fails, None if valid
     """
+    if state.shared_data.input_validated:
+        logger.debug(f"[{node_name}] State already validated this turn")
+        return None
 
     # Validate state exists
     logger.info(f"[{node_name}] Validating state")
@@ -46,16 +54,71 @@ def validate_input_state(state: AgentState, node_name: str) -> Optional[Command]
     # All validations passed - safe to log full state
     logger.info(f"[{node_name}] State is valid")
     logger.info(f"state: {state}")
+    state.shared_data.input_validated = True
     return None
 
 
-def update_state_metrics(state: AgentState, metric_name: str) -> None:
+def _message_text(content: Union[str, List[Union[str, Dict[str, Any]]]]) -> str:
+    """
+    Get the text of a message's content.
+
+    Args:
+        content: Message content, either a string or a list of content blocks
+
+    Returns:
+        str: The content itself, or the text blocks of list content joined with spaces
+    """
+    if isinstance(content, str):
+        return content
+    return " ".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
+
+
+def get_last_human_message(messages: Sequence[BaseMessage]) -> Optional[str]:
+    """
+    Get the text of the most recent human message.
+
+    Matches on the message's ``type`` discriminator ("human") rather than
+    isinstance, avoiding LangChain's __instancecheck__ dispatch per message.
+    List (multimodal) content is reduced to its text blocks.
+
+    Args:
+        messages: Conversation messages, oldest first
+
+    Returns:
+        Optional[str]: Text of the latest HumanMessage, or None if there is none
+    """
+    message = next((m for m in reversed(messages) if getattr(m, "type", None) == "human"), None)
+    return _message_text(message.content) if message is not None else None
+
+
+def get_current_query(state: AgentState) -> Optional[str]:
+    """
+    Get the user query for the current turn.
+
+    Reads the query cached on shared_data by the router, falling back to a scan
+    of the message history when the cache has not been populated.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Optional[str]: Current user query, or None if no human message exists
+    """
+    return state.shared_data.current_query or get_last_human_message(state.messages)
+
+
+def update_state_metrics(state: AgentState, metric_name: str, execution_time_ns: Optional[int] = None) -> None:
     """
     Update performance metrics and access tracking for workflow state.
 
     Args:
         state: Current workflow state
         metric_name: Name of the metric to update
+        execution_time_ns: Optional node execution time from time.perf_counter_ns()
     """
     if not state.shared_data:
         return
@@ -67,12 +130,15 @@ def update_state_metrics(state: AgentState, metric_name: str) -> None:
     if metric_name not in state.shared_data.performance_metrics:
         state.shared_data.performance_metrics[metric_name] = {}
 
-    state.shared_data.performance_metrics[metric_name].update(
+    metric = state.shared_data.performance_metrics[metric_name]
+    metric.update(
         {
             "access_count": state.shared_data.access_count,
             "last_accessed": state.shared_data.last_accessed,
         }
     )
+    if execution_time_ns is not None:
+        metric["execution_time_ms"] = execution_time_ns / 1_000_000
 
 
 def create_command(
@@ -82,6 +148,7 @@ def create_command(
     additional_updates: Optional[Dict[str, Any]] = None,
     trace_id: Optional[str] = None,
     node_name: Optional[str] = None,
+    execution_time_ns: Optional[int] = None,
 ) -> Command:
     """
     Create Command with standardized state update pattern.
@@ -93,21 +160,18 @@ def create_command(
         additional_updates: Optional additional state updates
         trace_id: Trace ID for logging (optional)
         node_name: Node name for logging (optional)
+        execution_time_ns: Optional node execution time recorded under metric_name
 
     Returns:
         Command: Standardized command with state updates
     """
-    # Convert single message to list for consistency
-    if not isinstance(messages, list):
-        messages = [messages]
-
     # Update metrics if provided
     if metric_name:
-        update_state_metrics(state, metric_name)
+        update_state_metrics(state, metric_name, execution_time_ns)
 
-    # Prepare update dictionary
+    # Single update dict that takes the caller's message list as-is
     update_dict = {
-        "messages": messages,
+        "messages": messages if isinstance(messages, list) else [messages],
         "shared_data": state.shared_data,
     }
 
@@ -5,7 +5,7 @@ This module provides formatting functions for immediate streaming of tool result
 to improve user experience with progressive response building.
 """
 
-from typing import Any
+from typing import Any, List
 
 from ai_book_seeker.core.logging import get_logger
 
@@ -94,22 +94,23 @@ def format_book_recommendation_response(book_result: Any) -> str:
             books = [book_result]
 
         # Process individual books if we have a list
-        books_text = []
+        books_text: List[str] = []
+        append_book = books_text.append
         for book in books:
             if hasattr(book, "title") and hasattr(book, "author"):
                 title = book.title
                 author = book.author
                 description = getattr(book, "description", "No description available")
                 price = getattr(book, "price", "Price not available")
-                books_text.append(f"📚 {title} by {author}\n   {description}\n   Price: {price}")
+                append_book(f"📚 {title} by {author}\n   {description}\n   Price: {price}")
             elif isinstance(book, dict):
                 title = book.get("title", "Unknown Title")
                 author = book.get("author", "Unknown Author")
                 description = book.get("description", "No description available")
                 price = book.get("price", "Price not available")
-                books_text.append(f"📚 {title} by {author}\n   {description}\n   Price: {price}")
+                append_book(f"📚 {title} by {author}\n   {description}\n   Price: {price}")
             else:
-                books_text.append(f"📚 {str(book)}")
+                append_book(f"📚 {str(book)}")
 
         if books_text:
             return "Book Recommendations:\n" + "\n\n".join(books_text)
@@ -7,23 +7,54 @@ import pytest
 # Import directly from the ai_book_seeker package
 from ai_book_seeker.db.database import Base
 from ai_book_seeker.db.models import Book
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from .helpers import create_test_book
 
 
-@pytest.fixture
-def test_db():
-    """Create an in-memory SQLite database for testing."""
+@pytest.fixture(scope="module")
+def test_engine():
+    """Create an in-memory SQLite engine and schema once per test module."""
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite_connection(dbapi_connection, connection_record):
+        # pysqlite's implicit transaction handling breaks SAVEPOINTs, so let SQLAlchemy emit BEGIN itself
+        dbapi_connection.isolation_level = None
+        # Test data is throwaway, so skip journal writes and fsyncs on commit
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def test_db(test_engine):
+    """Provide a database session whose changes are rolled back after each test."""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    # Session commits release a SAVEPOINT instead of committing the outer transaction
+    TestingSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=connection, join_transaction_mode="create_savepoint"
+    )
 
     db = TestingSessionLocal()
 
@@ -31,6 +62,8 @@ def test_db():
         yield db
     finally:
         db.close()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
@@ -54,6 +87,22 @@ def test_book(test_db):
     return book
 
 
+@pytest.fixture
+def seed_books(test_db):
+    """
+    Pytest fixture that returns a function for inserting several Book rows in one flush and commit.
+    Usage:
+        def test_something(test_db, seed_books):
+            seed_books([Book(title="A", ...), Book(title="B", ...)])
+    """
+
+    def _seed(books):
+        test_db.bulk_save_objects(books)
+        test_db.commit()
+
+    return _seed
+
+
 @pytest.fixture
 def book_factory():
     """
@@ -10,19 +10,25 @@ from pathlib import Path
 from unittest import mock
 
 from ai_book_seeker.core.config import AppSettings
-from ai_book_seeker.prompts import create_prompt_manager
+from ai_book_seeker.prompts import _load_all_prompts, create_prompt_manager
 
 
 class TestPromptVersioning(unittest.TestCase):
     """Test cases for the prompt versioning system"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Resolve the prompts directory once for all tests"""
+        cls.base_dir = Path(__file__).parent.parent / "src" / "ai_book_seeker" / "prompts"
+
     def setUp(self):
         """Set up test environment"""
         # Create test settings
         self.settings = AppSettings()
 
-        # Path to the prompts directory
-        self.base_dir = Path(__file__).parent.parent / "src" / "ai_book_seeker" / "prompts"
+        # Isolate the module-level preloaded prompts between tests
+        _load_all_prompts.cache_clear()
+        self.addCleanup(_load_all_prompts.cache_clear)
 
     def test_prompt_manager_creation(self):
         """Test creating a PromptManager instance"""
@@ -56,32 +62,22 @@ class TestPromptVersioning(unittest.TestCase):
             prompt_manager.get_prompt_path("invalid_type", "v1")
 
     def test_load_prompt(self):
-        """Test loading prompts from files"""
+        """Test loading prompts from the preloaded prompt files"""
         prompt_manager = create_prompt_manager(self.settings)
 
         # Test loading searcher prompt
-        with mock.patch.object(prompt_manager, "get_prompt_path") as mock_path:
-            mock_path.return_value = self.base_dir / "searcher" / "search_books_v1.txt"
-            with mock.patch("builtins.open", mock.mock_open(read_data="Searcher Prompt v1")) as mock_file:
-                prompt = prompt_manager.load_prompt("searcher", "v1")
-                self.assertEqual(prompt, "Searcher Prompt v1")
-                mock_file.assert_called_once_with(mock_path.return_value, "r")
+        prompt = prompt_manager.load_prompt("searcher", "v1")
+        expected = (self.base_dir / "searcher" / "search_books_v1.txt").read_text(encoding="utf-8")
+        self.assertEqual(prompt, expected)
 
         # Test loading explainer prompt
-        with mock.patch.object(prompt_manager, "get_prompt_path") as mock_path:
-            mock_path.return_value = self.base_dir / "explainer" / "explain_recommendation_v1.txt"
-            with mock.patch("builtins.open", mock.mock_open(read_data="Explainer Prompt v1")) as mock_file:
-                prompt = prompt_manager.load_prompt("explainer", "v1")
-                self.assertEqual(prompt, "Explainer Prompt v1")
-                mock_file.assert_called_once_with(mock_path.return_value, "r")
+        prompt = prompt_manager.load_prompt("explainer", "v2")
+        expected = (self.base_dir / "explainer" / "explain_recommendation_v2.txt").read_text(encoding="utf-8")
+        self.assertEqual(prompt, expected)
 
         # Test file not found
-        with mock.patch.object(prompt_manager, "get_prompt_path") as mock_path:
-            mock_path.return_value = self.base_dir / "nonexistent.txt"
-            with mock.patch("builtins.open", mock.mock_open()) as mock_file:
-                mock_file.side_effect = FileNotFoundError
-                with self.assertRaises(FileNotFoundError):
-                    prompt_manager.load_prompt("searcher", "nonexistent")
+        with self.assertRaises(FileNotFoundError):
+            prompt_manager.load_prompt("searcher", "nonexistent")
 
     def test_get_searcher_prompt(self):
         """Test getting the current searcher prompt"""
@@ -155,23 +151,19 @@ class TestPromptVersioning(unittest.TestCase):
             self.assertEqual(prompt_manager.system_prompt_version, "v1")
 
     def test_prompt_caching(self):
-        """Test that prompts are cached correctly"""
-        from ai_book_seeker.prompts import _prompt_cache
-
-        # Clear the cache before testing
-        _prompt_cache.clear()
-
-        prompt_manager = create_prompt_manager(self.settings)
+        """Test that prompt files are read once and shared across managers"""
+        create_prompt_manager(self.settings)
 
-        # Mock file reading
-        with mock.patch("builtins.open", mock.mock_open(read_data="Test Prompt")):
-            # Load the same prompt twice
+        # Prompts are preloaded, so later managers and loads never touch the filesystem
+        with mock.patch("builtins.open") as mock_file:
+            prompt_manager = create_prompt_manager(self.settings)
             prompt1 = prompt_manager.load_prompt("searcher", "v1")
             prompt2 = prompt_manager.load_prompt("searcher", "v1")
 
-            # Both should be the same
-            self.assertEqual(prompt1, prompt2)
-            self.assertEqual(prompt1, "Test Prompt")
+            self.assertIs(prompt1, prompt2)
+            self.assertIsInstance(prompt1, str)
+            mock_file.assert_not_called()
+        self.assertEqual(_load_all_prompts.cache_info().hits, 1)
 
     def test_prompt_settings_validation(self):
         """Test PromptSettings validation functionality"""
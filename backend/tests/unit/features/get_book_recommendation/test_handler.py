@@ -1,53 +1,67 @@
-import asyncio
 import contextlib
 
 import pytest
 from ai_book_seeker.db.models import Book
 from ai_book_seeker.features.get_book_recommendation.handler import (
+    clear_search_cache,
     get_book_recommendation_handler,
 )
 from ai_book_seeker.features.get_book_recommendation.schema import (
+    BOOK_RECOMMENDATION_ADAPTER,
+    BookRecommendation,
     BookRecommendationOutputSchema,
     BookRecommendationSchema,
 )
 from ai_book_seeker.utils.helpers import extract_age_range_from_message
 
 
-def run_async(coro):
-    return asyncio.get_event_loop().run_until_complete(coro)
+@pytest.fixture(autouse=True)
+def _clear_search_cache():
+    # Keep memoized search results from leaking between tests
+    clear_search_cache()
+    yield
+    clear_search_cache()
 
 
-def test_handler_with_valid_params_single_age(test_db, monkeypatch):
+def _session_factory(db=None):
+    """Build a db_session_factory that yields the given session instead of opening one."""
+    return lambda settings: contextlib.nullcontext(db)
+
+
+def _no_books(**kwargs):
+    return []
+
+
+@pytest.mark.asyncio
+async def test_handler_with_valid_params_single_age(test_db, seed_books):
     # Insert a test book for a single age
-    book = Book(
-        title="Test Book Single Age",
-        author="Author",
-        description="A book for testing single age.",
-        from_age=12,
-        to_age=12,
-        purpose="learning",
-        genre="fiction",
-        price=9.99,
-        tags="test,fiction",
-        quantity=5,
-    )
-    test_db.add(book)
-    test_db.commit()
-    test_db.refresh(book)
+    seed_books(
+        [
+            Book(
+                title="Test Book Single Age",
+                author="Author",
+                description="A book for testing single age.",
+                from_age=12,
+                to_age=12,
+                purpose="learning",
+                genre="fiction",
+                price=9.99,
+                tags="test,fiction",
+                quantity=5,
+            )
+        ]
+    )
 
     request = BookRecommendationSchema(
         age=12, age_from=None, age_to=None, purpose="learning", budget=20.0, genre="fiction"
     )
 
-    @contextlib.contextmanager
-    def fake_get_db_session():
-        yield test_db
-
-    monkeypatch.setattr(
-        "ai_book_seeker.features.get_book_recommendation.handler.get_db_session",
-        fake_get_db_session,
+    result = await get_book_recommendation_handler(
+        request,
+        "I want a book for learning for a 12 year old",
+        settings=None,
+        db_session_factory=_session_factory(test_db),
     )
-    result = run_async(get_book_recommendation_handler(request, "I want a book for learning for a 12 year old"))
 
     assert isinstance(result, BookRecommendationOutputSchema)
     assert len(result.data) == 1
@@ -55,37 +69,36 @@ def test_handler_with_valid_params_single_age(test_db, monkeypatch):
     assert result.data[0].purpose == "learning"
 
 
-def test_handler_with_valid_params_range(test_db, monkeypatch):
+@pytest.mark.asyncio
+async def test_handler_with_valid_params_range(test_db, seed_books):
     # Insert a test book for an age range
-    book = Book(
-        title="Test Book Range",
-        author="Author",
-        description="A book for testing range.",
-        from_age=10,
-        to_age=15,
-        purpose="learning",
-        genre="fiction",
-        price=9.99,
-        tags="test,fiction",
-        quantity=5,
-    )
-    test_db.add(book)
-    test_db.commit()
-    test_db.refresh(book)
+    seed_books(
+        [
+            Book(
+                title="Test Book Range",
+                author="Author",
+                description="A book for testing range.",
+                from_age=10,
+                to_age=15,
+                purpose="learning",
+                genre="fiction",
+                price=9.99,
+                tags="test,fiction",
+                quantity=5,
+            )
+        ]
+    )
 
     request = BookRecommendationSchema(
         age=None, age_from=10, age_to=15, purpose="learning", budget=20.0, genre="fiction"
     )
 
-    @contextlib.contextmanager
-    def fake_get_db_session():
-        yield test_db
-
-    monkeypatch.setattr(
-        "ai_book_seeker.features.get_book_recommendation.handler.get_db_session",
-        fake_get_db_session,
+    result = await get_book_recommendation_handler(
+        request,
+        "I want a book for learning for ages 10 to 15",
+        settings=None,
+        db_session_factory=_session_factory(test_db),
     )
-    result = run_async(get_book_recommendation_handler(request, "I want a book for learning for ages 10 to 15"))
 
     assert isinstance(result, BookRecommendationOutputSchema)
     assert len(result.data) == 1
@@ -93,28 +106,30 @@ def test_handler_with_valid_params_range(test_db, monkeypatch):
     assert result.data[0].purpose == "learning"
 
 
-def test_handler_with_no_results(monkeypatch):
-    monkeypatch.setattr(
-        "ai_book_seeker.features.get_book_recommendation.handler.search_books_by_criteria",
-        lambda db, age_from, age_to, purpose, budget, genre: [],
-    )
+@pytest.mark.asyncio
+async def test_handler_with_no_results():
     request = BookRecommendationSchema(
         age=99, age_from=None, age_to=None, purpose="unknown", budget=1.0, genre="nonexistent"
     )
-    result = run_async(get_book_recommendation_handler(request, "I want a book for an unknown purpose"))
+    result = await get_book_recommendation_handler(
+        request,
+        "I want a book for an unknown purpose",
+        settings=None,
+        search_fn=_no_books,
+        db_session_factory=_session_factory(),
+    )
     assert isinstance(result, BookRecommendationOutputSchema)
     assert result.data == []
     assert "couldn't find any books" in result.text or "I couldn't find any books" in result.text
 
 
-def test_handler_with_missing_params(monkeypatch):
+@pytest.mark.asyncio
+async def test_handler_with_missing_params():
     # Should still work with all params None
-    monkeypatch.setattr(
-        "ai_book_seeker.features.get_book_recommendation.handler.search_books_by_criteria",
-        lambda db, age_from, age_to, purpose, budget, genre: [],
-    )
     request = BookRecommendationSchema(age=None, age_from=None, age_to=None, purpose=None, budget=None, genre=None)
-    result = run_async(get_book_recommendation_handler(request, ""))
+    result = await get_book_recommendation_handler(
+        request, "", settings=None, search_fn=_no_books, db_session_factory=_session_factory()
+    )
     assert isinstance(result, BookRecommendationOutputSchema)
     assert isinstance(result.data, list)
     # Purpose should not be inferred
@@ -123,6 +138,79 @@ def test_handler_with_missing_params(monkeypatch):
             assert not book.purpose
 
 
+@pytest.mark.asyncio
+async def test_handler_memoizes_identical_searches():
+    calls = []
+
+    def fake_search(**kwargs):
+        calls.append(kwargs)
+        return [BookRecommendation(id=1, title="Cached Book", author="Author", price=9.99, reason="Fits.")]
+
+    session_factory = _session_factory()
+    request = BookRecommendationSchema(
+        age=12, age_from=None, age_to=None, purpose="learning", budget=20.0, genre="fiction"
+    )
+    await get_book_recommendation_handler(
+        request, "", settings=None, search_fn=fake_search, db_session_factory=session_factory
+    )
+    result = await get_book_recommendation_handler(
+        request, "", settings=None, search_fn=fake_search, db_session_factory=session_factory
+    )
+    assert len(calls) == 1
+    assert [book.title for book in result.data] == ["Cached Book"]
+
+    clear_search_cache()
+    await get_book_recommendation_handler(
+        request, "", settings=None, search_fn=fake_search, db_session_factory=session_factory
+    )
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_handler_cache_is_keyed_on_injected_search_fn():
+    session_factory = _session_factory()
+    request = BookRecommendationSchema(
+        age=12, age_from=None, age_to=None, purpose="learning", budget=20.0, genre="fiction"
+    )
+
+    def first_search(**kwargs):
+        return [BookRecommendation(id=1, title="First Book", author="Author", price=9.99, reason="Fits.")]
+
+    def second_search(**kwargs):
+        return [BookRecommendation(id=2, title="Second Book", author="Author", price=9.99, reason="Fits.")]
+
+    first = await get_book_recommendation_handler(
+        request, "", settings=None, search_fn=first_search, db_session_factory=session_factory
+    )
+    second = await get_book_recommendation_handler(
+        request, "", settings=None, search_fn=second_search, db_session_factory=session_factory
+    )
+    assert [book.title for book in first.data] == ["First Book"]
+    assert [book.title for book in second.data] == ["Second Book"]
+
+
+@pytest.mark.asyncio
+async def test_handler_does_not_cache_empty_results():
+    # The search reports failures as an empty list, so "no books" must not be memoized
+    calls = []
+
+    def fake_search(**kwargs):
+        calls.append(kwargs)
+        return []
+
+    session_factory = _session_factory()
+    request = BookRecommendationSchema(
+        age=12, age_from=None, age_to=None, purpose="learning", budget=20.0, genre="fiction"
+    )
+    await get_book_recommendation_handler(
+        request, "", settings=None, search_fn=fake_search, db_session_factory=session_factory
+    )
+    await get_book_recommendation_handler(
+        request, "", settings=None, search_fn=fake_search, db_session_factory=session_factory
+    )
+    assert len(calls) == 2
+
+
 def test_schema_validation():
     # Valid instantiation
     schema = BookRecommendationSchema(
@@ -137,11 +225,20 @@ def test_schema_validation():
         BookRecommendationSchema(age="not-an-int", age_from=None, age_to=None, purpose=None, budget=None, genre=None)  # type: ignore
 
 
-def test_handler_purpose_only_when_explicit(monkeypatch):
+def test_schema_adapter_validates_frozen_request():
+    request = BOOK_RECOMMENDATION_ADAPTER.validate_python({"age": "12+", "purpose": "", "genre": "fiction"})
+    assert isinstance(request, BookRecommendationSchema)
+    assert request.age == 12
+    assert request.purpose is None
+    with pytest.raises(ValueError):
+        request.age = 13  # type: ignore[misc]
+
+
+@pytest.mark.asyncio
+async def test_handler_purpose_only_when_explicit():
     # If purpose is not explicit, it should not be set in the output
-    monkeypatch.setattr(
-        "ai_book_seeker.features.get_book_recommendation.handler.search_books_by_criteria",
-        lambda db, age_from, age_to, purpose, budget, genre: [
+    def fake_search(**kwargs):
+        return [
             Book(
                 title="Adventure Book",
                 author="Author",
@@ -154,39 +251,44 @@ def test_handler_purpose_only_when_explicit(monkeypatch):
                 tags="adventure",
                 quantity=3,
             )
-        ],
-    )
+        ]
+
     request = BookRecommendationSchema(age=12, age_from=None, age_to=None, purpose=None, budget=20.0, genre="adventure")
-    result = run_async(get_book_recommendation_handler(request, "I want a book about adventure"))
+    result = await get_book_recommendation_handler(
+        request,
+        "I want a book about adventure",
+        settings=None,
+        search_fn=fake_search,
+        db_session_factory=_session_factory(),
+    )
     assert isinstance(result, BookRecommendationOutputSchema)
     if result.data:
         for book in result.data:
             assert not book.purpose
 
 
-def test_extract_age_range_from_message_range():
-    assert extract_age_range_from_message("from 16 to 31") == (16, 31)
-    assert extract_age_range_from_message("16-31") == (16, 31)
-    assert extract_age_range_from_message("16 to 31") == (16, 31)
-
-
-def test_extract_age_range_from_message_less_than():
-    assert extract_age_range_from_message("under 33") == (None, 32)
-    assert extract_age_range_from_message("less than 20") == (None, 19)
-    assert extract_age_range_from_message("below 18") == (None, 17)
-
-
-def test_extract_age_range_from_message_greater_than():
-    assert extract_age_range_from_message("over 33") == (34, None)
-    assert extract_age_range_from_message("more than 20") == (21, None)
-    assert extract_age_range_from_message("above 18") == (19, None)
-
-
-def test_extract_age_range_from_message_single_age():
-    assert extract_age_range_from_message("age 16") == (16, 16)
-    assert extract_age_range_from_message("16 year old") == (16, 16)
-    assert extract_age_range_from_message("for a 12 year-old reader") == (12, 12)
-
-
-def test_extract_age_range_from_message_no_match():
-    assert extract_age_range_from_message("I want a book for adults") == (None, None)
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        # Ranges
+        ("from 16 to 31", (16, 31)),
+        ("16-31", (16, 31)),
+        ("16 to 31", (16, 31)),
+        # Less than
+        ("under 33", (None, 32)),
+        ("less than 20", (None, 19)),
+        ("below 18", (None, 17)),
+        # Greater than
+        ("over 33", (34, None)),
+        ("more than 20", (21, None)),
+        ("above 18", (19, None)),
+        # Single age
+        ("age 16", (16, 16)),
+        ("16 year old", (16, 16)),
+        ("for a 12 year-old reader", (12, 12)),
+        # No match
+        ("I want a book for adults", (None, None)),
+    ],
+)
+def test_extract_age_range_from_message(message, expected):
+    assert extract_age_range_from_message(message) == expected
@@ -0,0 +1,62 @@
+"""
+Unit tests for the workflow CommandBuilder.
+"""
+
+import pytest
+from ai_book_seeker.workflows.utils.command_builder import CommandBuilder
+
+
+class TestCommandBuilder:
+    """Test the CommandBuilder class."""
+
+    def test_build_messages_only(self):
+        """Test building a command with only messages."""
+        command = CommandBuilder().add_message("first").add_messages(["second", "third"]).build()
+
+        assert command.update == {"messages": ["first", "second", "third"]}
+
+    def test_build_with_state_updates(self):
+        """Test that state updates are merged after messages."""
+        command = (
+            CommandBuilder()
+            .add_message("msg")
+            .set("agent_results", {"faq": "answer"})
+            .update({"shared_data": "data", "agent_results": {"faq": "override"}})
+            .build()
+        )
+
+        assert command.update == {
+            "messages": ["msg"],
+            "agent_results": {"faq": "override"},
+            "shared_data": "data",
+        }
+
+    def test_update_does_not_modify_input(self):
+        """Test that update() reads from the caller's dict without writing to it."""
+        updates = {"shared_data": "data"}
+        CommandBuilder().update(updates).set("agent_results", "results").build()
+
+        assert updates == {"shared_data": "data"}
+
+    def test_takes_over_initial_messages(self):
+        """Test that an initial message list is used as-is rather than copied."""
+        messages = ["first"]
+
+        command = CommandBuilder(messages).add_message("second").build()
+
+        assert command.update["messages"] is messages
+        assert messages == ["first", "second"]
+
+    def test_slots(self):
+        """Test that the builder does not carry a per-instance __dict__."""
+        assert not hasattr(CommandBuilder(), "__dict__")
+
+    def test_build_is_single_use(self):
+        """Test that a built builder cannot hand its update dict to a second Command."""
+        builder = CommandBuilder().add_message("msg")
+        builder.build()
+
+        with pytest.raises(RuntimeError):
+            builder.build()
+        with pytest.raises(RuntimeError):
+            builder.set("shared_data", "data")
@@ -0,0 +1,28 @@
+"""
+Unit tests for LLM parameter validation and cleaning.
+"""
+
+import pytest
+from ai_book_seeker.workflows.routing.parameter_extraction import _validate_and_clean_parameters
+
+
+class TestIsbnValidation:
+    """Test ISBN normalization in _validate_and_clean_parameters."""
+
+    @pytest.mark.parametrize(
+        "isbn, expected",
+        [
+            ("0306406152", "0306406152"),
+            ("0-306-40615-2", "0306406152"),
+            ("978-0-306-40615-7", "9780306406157"),
+            (" 978 0 306 40615 7 ", "9780306406157"),
+        ],
+    )
+    def test_accepts_10_and_13_digit_isbns(self, isbn, expected):
+        """Test that hyphens and spaces are stripped from valid ISBNs."""
+        assert _validate_and_clean_parameters({"isbn": isbn})["isbn"] == expected
+
+    @pytest.mark.parametrize("isbn", ["0-306-40615-21", "978-0-306-40615", "97803064061", "", "not-an-isbn"])
+    def test_rejects_invalid_lengths_and_non_digits(self, isbn):
+        """Test that 11- and 12-digit values and non-numeric strings are dropped."""
+        assert "isbn" not in _validate_and_clean_parameters({"isbn": isbn})
@@ -0,0 +1,219 @@
+"""
+Unit tests for workflow state schemas and the StateManager.
+"""
+
+import time
+
+from ai_book_seeker.workflows.schemas.agents import AgentInsight, AgentResults
+from ai_book_seeker.workflows.schemas.state import (
+    AgentState,
+    SharedData,
+    StateManager,
+    merge_agent_results,
+    merge_shared_data,
+)
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+
+class TestAgentStateSerialization:
+    """Test the AgentState JSON round trip."""
+
+    def test_json_round_trip_preserves_messages_and_timestamps(self):
+        """Test that message subclasses and timestamps survive to_json/from_json."""
+        state = StateManager().create_initial_state("session-1", "chat", "books for a 12 year old")
+        state.messages.extend(
+            [
+                SystemMessage(content="routing", additional_kwargs={"message_type": "routing_decision"}),
+                AIMessage(content="Here are some books"),
+            ]
+        )
+        state.shared_data.update_access_metrics()
+
+        restored = AgentState.from_json(state.to_json())
+
+        assert [type(message) for message in restored.messages] == [HumanMessage, SystemMessage, AIMessage]
+        assert restored.messages[0].content == "books for a 12 year old"
+        assert restored.messages[1].additional_kwargs == {"message_type": "routing_decision"}
+        assert restored.created_at == state.created_at
+        assert restored.execution_start_time == state.execution_start_time
+        assert restored.shared_data.created_at == state.shared_data.created_at
+        assert restored.shared_data.last_accessed == state.shared_data.last_accessed
+        assert restored.shared_data.access_count == 1
+
+
+class TestAccessMetrics:
+    """Test access metric bookkeeping."""
+
+    def test_last_accessed_is_wall_clock(self):
+        """Test that last_accessed is a wall-clock timestamp comparable across processes."""
+        shared_data = SharedData()
+        before = time.time()
+
+        shared_data.update_access_metrics()
+
+        assert before <= shared_data.last_accessed <= time.time()
+        assert shared_data.access_count == 1
+
+
+def _insight(agent_name: str) -> AgentInsight:
+    return AgentInsight(
+        agent_name=agent_name, role="analyst", query_analysis="analysis", reasoning="reasoning", confidence=0.9
+    )
+
+
+class TestStateReducers:
+    """Test the LangGraph channel reducers."""
+
+    def test_merge_shared_data_does_not_mutate_inputs(self):
+        """Test that merging leaves the accumulated value (shared with checkpoints) untouched."""
+        left = SharedData(agent_insights=[_insight("faq_agent")], performance_metrics={"router": {"access_count": 1}})
+        right = SharedData(
+            agent_insights=[_insight("faq_agent"), _insight("book_agent")],
+            performance_metrics={"faq_tool": {"access_count": 2}},
+            current_query="books about space",
+            access_count=2,
+        )
+
+        merged = merge_shared_data(left, right)
+
+        assert merged is not left
+        assert [insight.agent_name for insight in merged.agent_insights] == ["faq_agent", "book_agent"]
+        assert set(merged.performance_metrics) == {"router", "faq_tool"}
+        assert merged.current_query == "books about space"
+        assert merged.access_count == 2
+        assert [insight.agent_name for insight in left.agent_insights] == ["faq_agent"]
+        assert left.get_insight_agent_names() == {"faq_agent"}
+        assert set(left.performance_metrics) == {"router"}
+        assert left.current_query is None
+
+    def test_merged_shared_data_does_not_alias_left_containers(self):
+        """Test that later in-place node writes on the merged value do not reach left."""
+        left = SharedData(agent_insights=[_insight("faq_agent")])
+
+        merged = merge_shared_data(left, SharedData())
+        merged.add_agent_insight(_insight("book_agent"))
+        merged.performance_metrics["router"] = {}
+
+        assert len(left.agent_insights) == 1
+        assert left.performance_metrics == {}
+
+    def test_merge_after_agent_insights_reassignment(self):
+        """Test that reassigning agent_insights does not leave stale names blocking the merge."""
+        left = SharedData()
+        left.add_agent_insight(_insight("faq_agent"))
+        left.agent_insights = []
+
+        merged = merge_shared_data(left, SharedData(agent_insights=[_insight("faq_agent")]))
+
+        assert [insight.agent_name for insight in merged.agent_insights] == ["faq_agent"]
+
+    def test_merge_agent_results_does_not_mutate_inputs(self):
+        """Test that non-empty right fields win without writing into left."""
+        left = AgentResults(book_details={"title": "old"})
+        right = AgentResults(book_details={"title": "new"}, faq={"text": "answer", "data": []})
+
+        merged = merge_agent_results(left, right)
+
+        assert merged.book_details == {"title": "new"}
+        assert merged.faq.text == "answer"
+        assert left.book_details == {"title": "old"}
+        assert left.faq is None
+
+
+def _create_states(manager: StateManager, *session_ids: str) -> None:
+    for session_id in session_ids:
+        manager.create_initial_state(session_id, "chat", "hello")
+
+
+class TestStateManagerCache:
+    """Test the bounded LRU state cache."""
+
+    def test_evicts_least_recently_created_state(self):
+        """Test that inserting past capacity evicts the oldest session."""
+        manager = StateManager(max_size=2)
+        _create_states(manager, "a", "b", "c")
+
+        assert list(manager.state_cache) == ["b", "c"]
+
+    def test_access_refreshes_recency(self):
+        """Test that reading a session's summary protects it from eviction."""
+        manager = StateManager(max_size=2)
+        _create_states(manager, "a", "b")
+
+        assert manager.get_state_summary("a")["session_id"] == "a"
+        _create_states(manager, "c")
+
+        assert list(manager.state_cache) == ["a", "c"]
+        assert manager.get_state_summary("b") is None
+
+    def test_replacing_session_moves_it_to_most_recent(self):
+        """Test that recreating an existing session replaces it without evicting others."""
+        manager = StateManager(max_size=2)
+        _create_states(manager, "a", "b")
+        original = manager.state_cache["a"]
+
+        _create_states(manager, "a")
+
+        assert list(manager.state_cache) == ["b", "a"]
+        assert manager.state_cache["a"] is not original
+
+    def test_cleanup_skipped_below_threshold(self):
+        """Test that the TTL sweep only runs once the cache is above 80% of capacity."""
+        manager = StateManager(max_size=10)
+        _create_states(manager, *"abcdefgh")
+        for state in manager.state_cache.values():
+            state.created_at -= 7200
+
+        assert manager.cleanup_old_states(max_age_seconds=3600) == 0
+        assert len(manager.state_cache) == 8
+
+        _create_states(manager, "i")
+        assert manager.cleanup_old_states(max_age_seconds=3600) == 8
+        assert list(manager.state_cache) == ["i"]
+
+
+class TestStateManagerMetrics:
+    """Test the StateManager running totals."""
+
+    def test_total_sessions_counts_lifetime_creations(self):
+        """Test that replaced and evicted sessions still count as processed."""
+        manager = StateManager(max_size=2)
+        _create_states(manager, "a", "b", "c", "c")
+
+        metrics = manager.get_performance_metrics()
+
+        assert metrics["cached_states_count"] == 2
+        assert metrics["total_sessions_processed"] == 4
+
+    def test_average_access_count_is_live(self):
+        """Test that accesses show up without a cleanup sweep at the default capacity."""
+        manager = StateManager()
+        _create_states(manager, "a", "b", "c")
+        for state in manager.state_cache.values():
+            for _ in range(5):
+                state.shared_data.update_access_metrics()
+
+        assert manager.get_performance_metrics()["average_access_count"] == 5
+
+        assert manager.cleanup_old_states() == 0
+        assert manager.get_performance_metrics()["average_access_count"] == 5
+
+    def test_average_access_count_after_eviction(self):
+        """Test that evicted sessions no longer count towards the average."""
+        manager = StateManager(max_size=2)
+        _create_states(manager, "a", "b")
+        for _ in range(3):
+            manager.state_cache["a"].shared_data.update_access_metrics()
+        manager.state_cache["b"].shared_data.update_access_metrics()
+
+        _create_states(manager, "c")
+
+        assert list(manager.state_cache) == ["b", "c"]
+        assert manager.get_performance_metrics()["average_access_count"] == 0.5
+
+    def test_metrics_for_empty_cache(self):
+        """Test that an empty cache reports zero averages."""
+        metrics = StateManager().get_performance_metrics()
+
+        assert metrics["cached_states_count"] == 0
+        assert metrics["average_access_count"] == 0
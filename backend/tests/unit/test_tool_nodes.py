@@ -0,0 +1,83 @@
+"""
+Unit tests for workflow tool nodes.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from ai_book_seeker.core.config import WorkflowSettings
+from ai_book_seeker.workflows.constants import FAQ_TOOL_NODE, TOOL_ERROR_MESSAGE_TYPE
+from ai_book_seeker.workflows.nodes import tool_nodes
+from ai_book_seeker.workflows.schemas.state import StateManager
+
+
+@pytest.fixture
+def state():
+    return StateManager().create_initial_state("session-1", "chat", "What is your return policy?")
+
+
+@pytest.fixture
+def slow_faq_tool(monkeypatch):
+    async def slow_run_faq_tool(extracted_parameters, faq_service):
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(tool_nodes, "run_faq_tool", slow_run_faq_tool)
+
+
+class TestToolTimeout:
+    """Test the per-tool execution budget."""
+
+    def test_workflow_settings_timeout(self, monkeypatch):
+        """Test the default budget and its environment override."""
+        assert WorkflowSettings().tool_timeout_seconds == 30.0
+
+        monkeypatch.setenv("WORKFLOW_TOOL_TIMEOUT_SECONDS", "2.5")
+        assert WorkflowSettings().tool_timeout_seconds == 2.5
+
+    def test_workflow_settings_rejects_non_positive_timeout(self):
+        """Test that a zero budget is rejected."""
+        with pytest.raises(ValueError):
+            WorkflowSettings(tool_timeout_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_slow_tool_returns_tool_error(self, state, slow_faq_tool):
+        """Test that a tool exceeding its budget yields a tool_error message."""
+        settings = SimpleNamespace(workflow=WorkflowSettings(tool_timeout_seconds=0.05))
+
+        command = await tool_nodes.faq_tool_node(state, faq_service=None, settings=settings)
+
+        [error_msg] = command.update["messages"]
+        assert error_msg.additional_kwargs["message_type"] == TOOL_ERROR_MESSAGE_TYPE
+        assert error_msg.additional_kwargs["timeout_seconds"] == 0.05
+        assert error_msg.content == f"{FAQ_TOOL_NODE} timed out after 0.05s"
+
+
+class TestToolExecutionMetrics:
+    """Test that every tool node exit records its execution time."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_records_execution_time(self, state, slow_faq_tool):
+        """Test that the timeout path records execution_time_ms."""
+        settings = SimpleNamespace(workflow=WorkflowSettings(tool_timeout_seconds=0.05))
+
+        command = await tool_nodes.faq_tool_node(state, faq_service=None, settings=settings)
+
+        metric = command.update["shared_data"].performance_metrics[FAQ_TOOL_NODE]
+        assert metric["execution_time_ms"] >= 50
+
+    @pytest.mark.asyncio
+    async def test_error_records_execution_time(self, state, monkeypatch):
+        """Test that an unexpected tool error records execution_time_ms."""
+
+        async def failing_run_faq_tool(extracted_parameters, faq_service):
+            raise RuntimeError("FAQ store unavailable")
+
+        monkeypatch.setattr(tool_nodes, "run_faq_tool", failing_run_faq_tool)
+        settings = SimpleNamespace(workflow=WorkflowSettings())
+
+        command = await tool_nodes.faq_tool_node(state, faq_service=None, settings=settings)
+
+        [error_msg] = command.update["messages"]
+        assert "FAQ store unavailable" in error_msg.content
+        assert "execution_time_ms" in command.update["shared_data"].performance_metrics[FAQ_TOOL_NODE]